@@ -1,11 +1,15 @@
-from fastapi import APIRouter
-from .endpoints import auth, articles
+from fastapi import APIRouter, Depends
+from .endpoints import auth, articles, debug, feed
+from ..core.security import require_admin
 
 api_router = APIRouter()
 
 # Include routers for different endpoints
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(articles.router, prefix="/articles", tags=["articles"])
+api_router.include_router(feed.router, prefix="/feed", tags=["feed"])
+# Run traces are operator-only: they need the admin token and 403 when none is configured
+api_router.include_router(debug.router, prefix="/debug", tags=["debug"], dependencies=[Depends(require_admin)])
 # We'll add more routers as we develop them
 # api_router.include_router(users.router, prefix="/users", tags=["users"])
 # api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
\ No newline at end of file
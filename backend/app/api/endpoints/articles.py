@@ -1,35 +1,62 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+import asyncio
 import uuid
 import logging
 
 from ...db.base import get_database
-from ...schemas.article import Article, ArticleCreate, ArticleInDB
-from ...services.news_api_service import get_articles
+from ...db.migrations import fill_article_defaults
+from ...schemas.article import (
+    Article, ArticleBatch, ArticleBatchRequest, ArticleCreate, ArticleInDB, ArticlePage, ArticleSummary,
+    article_list_projection
+)
+from ...services.ingestion_scheduler import ingestion_scheduler
+from ...services.providers import normalize_published_date, provider_registry
+from ...services.provider_gateway import provider_gateway
+from ...services.search_service import search_articles
+from ...core.cache import article_cache
 from ...core.config import settings
+from ...core.pagination import ARTICLE_SORT, NEXT_CURSOR_HEADER, cursor_filter, next_cursor
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.get("/", response_model=List[Article])
+FIELDS_DESCRIPTION = "Comma-separated extra Article fields to include, e.g. content,created_at"
+
+def list_projection(fields: Optional[str]) -> Dict[str, Any]:
+    try:
+        return article_list_projection(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/", response_model=ArticlePage)
 async def read_articles(
+    response: Response,
     skip: int = 0,
     limit: int = 20,
     category: Optional[str] = None,
     source: Optional[str] = None,
     search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; replaces skip"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
     """
     Retrieve articles with optional filtering.
+    search accepts words, "exact phrases" and -excluded terms; results are ordered by relevance.
+    Without search, next_cursor (also sent as the X-Next-Cursor header) fetches the next page.
     """
+    if cursor and search:
+        raise HTTPException(status_code=400, detail="cursor cannot be combined with search; use skip")
+    projection = list_projection(fields)
+    # Build query filter
+    filter_query = cursor_filter(cursor) if cursor else {}
+    next_page = None
+    
     try:
-        # Build query filter
-        filter_query = {}
-        
         if category:
             filter_query["categories"] = category
             
@@ -37,99 +64,65 @@ async def read_articles(
             filter_query["source"] = source
             
         if search:
-            filter_query["$or"] = [
-                {"title": {"$regex": search, "$options": "i"}},
-                {"synopsis": {"$regex": search, "$options": "i"}},
-                {"content": {"$regex": search, "$options": "i"}}
-            ]
-        
-        # Get articles from database
-        cursor = db["articles"].find(filter_query).sort("published_date", -1).skip(skip).limit(limit)
-        
-        articles = await cursor.to_list(length=limit)
+            # Ranked by relevance rather than date
+            articles = await search_articles(db, search, filter_query, skip, limit, projection)
+        else:
+            # Get articles from database; a cursor already encodes the position
+            db_cursor = (
+                db["articles"].find(filter_query, projection)
+                .sort(ARTICLE_SORT).skip(0 if cursor else skip).limit(limit)
+            )
+            articles = await db_cursor.to_list(length=limit)
+            
+            next_page = next_cursor(articles, limit)
+            if next_page:
+                response.headers[NEXT_CURSOR_HEADER] = next_page
         
-        # Ensure all articles have required fields
+        # Legacy documents the backfill migration hasn't reached yet
         for article in articles:
-            if "title" not in article or not article["title"]:
-                article["title"] = "Untitled Article"
-            if "source" not in article or not article["source"]:
-                article["source"] = "Unknown Source"
-            if "source_url" not in article or not article["source_url"]:
-                article["source_url"] = "https://example.com"
-            if "published_date" not in article:
-                article["published_date"] = datetime.utcnow()
-            if "synopsis" not in article:
-                article["synopsis"] = ""
-            if "content" not in article:
-                article["content"] = ""
-                
-        return articles
+            fill_article_defaults(article, projection)
+        return {"items": articles, "next_cursor": next_page}
     except Exception as e:
         logger.exception(f"Error reading articles: {str(e)}")
-        return []
+        return ArticlePage()
 
-@router.get("/latest", response_model=List[Article])
+@router.get("/latest", response_model=ArticlePage)
 async def get_latest_articles(
+    request: Request,
     limit: int = 20,
     refresh: bool = False,
     categories: Optional[List[str]] = Query(None),
-    sources: Optional[List[str]] = Query(None, description="Filter by news sources (newsapi, gnews, guardian)"),
+    sources: Optional[List[str]] = Query(None, description="Filter by news sources (provider ids, see /articles/sources/list)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
     """
-    Get the latest articles. Set refresh=true to fetch new articles from sources.
+    Get the latest articles. Set refresh=true to queue a fetch of new articles from sources
+    (only the requested categories and sources, when given); the response waits at most
+    REFRESH_MAX_WAIT_SECONDS for it.
+    next_cursor (also sent as the X-Next-Cursor header) fetches the next page.
     """
+    projection = list_projection(fields)
+    page_filter = cursor_filter(cursor) if cursor else {}
+    
     try:
         if refresh:
-            # Fetch new articles from news APIs
-            new_articles = await get_articles(categories)
-            
-            # Filter by source if requested
-            if sources:
-                source_map = {
-                    "newsapi": "NewsAPI",
-                    "gnews": "GNews", 
-                    "guardian": "The Guardian"
-                }
-                
-                # Convert sources to their display names
-                source_display_names = [source_map.get(s.lower(), s) for s in sources]
-                
-                # Filter articles by source
-                new_articles = [
-                    article for article in new_articles
-                    if article.get("source") in source_display_names
-                ]
-            
-            # Insert new articles if they don't exist
-            if new_articles:
-                for article in new_articles:
-                    try:
-                        # Check if article already exists (by source_url)
-                        existing = await db["articles"].find_one({"source_url": article["source_url"]})
-                        if not existing:
-                            # Ensure all required fields exist
-                            if "id" not in article:
-                                article["id"] = str(uuid.uuid4())
-                            if "created_at" not in article:
-                                article["created_at"] = datetime.utcnow()
-                            if "updated_at" not in article:
-                                article["updated_at"] = datetime.utcnow()
-                                
-                            await db["articles"].insert_one(article)
-                    except Exception as e:
-                        logger.error(f"Error saving article: {str(e)}")
+            # Ingestion runs in the background; wait a bounded time so a quick
+            # refresh is still visible in this response
+            refreshed = ingestion_scheduler.request_refresh(categories, sources)
+            try:
+                await asyncio.wait_for(asyncio.shield(refreshed), timeout=settings.REFRESH_MAX_WAIT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.info("Refresh still running; serving stored articles")
         
         # Build query for retrieving articles
-        filter_query = {}
+        filter_query = dict(page_filter)
         
         # Add source filter if requested
+        source_display_names = []
         if sources:
-            source_map = {
-                "newsapi": "NewsAPI",
-                "gnews": "GNews", 
-                "guardian": "The Guardian"
-            }
+            source_map = provider_registry.source_labels()
             source_display_names = [source_map.get(s.lower(), s) for s in sources]
             filter_query["source"] = {"$in": source_display_names}
             
@@ -137,48 +130,117 @@ async def get_latest_articles(
         if categories:
             filter_query["categories"] = {"$in": categories}
         
+        # Ingestion bumps the cache generation, so a completed refresh misses here
+        cache_key = article_cache.key(
+            "latest", limit=limit, categories=categories or [],
+            sources=source_display_names, cursor=cursor, fields=sorted(projection)
+        )
+        cached = article_cache.get(cache_key)
+        if cached is not None:
+            return cached.to_response(request)
+        
         # Get the latest articles from database
-        cursor = db["articles"].find(filter_query).sort("published_date", -1).limit(limit)
+        db_cursor = db["articles"].find(filter_query, projection).sort(ARTICLE_SORT).limit(limit)
         
-        articles = await cursor.to_list(length=limit)
+        articles = await db_cursor.to_list(length=limit)
+        for article in articles:
+            fill_article_defaults(article, projection)
         
         # Log the number of articles retrieved
         logger.info(f"Retrieved {len(articles)} articles from database")
         
-        return articles
+        next_page = next_cursor(articles, limit)
+        headers = {NEXT_CURSOR_HEADER: next_page} if next_page else None
+        page = {"items": articles, "next_cursor": next_page}
+        return article_cache.store(cache_key, page, ArticlePage, headers).to_response(request)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.exception(f"Error in get_latest_articles: {str(e)}")
-        # Return empty list instead of raising exception
-        return []
+        # Return an empty page instead of raising exception
+        return ArticlePage()
+
+async def get_article_batch(db: AsyncIOMotorDatabase, ids: List[str], projection: Dict[str, Any]) -> ArticleBatch:
+    # Comma-separated values are split so ?ids=a,b works as well as ?ids=a&ids=b
+    requested = list(dict.fromkeys(i.strip() for value in ids for i in value.split(",") if i.strip()))
+    if len(requested) > settings.ARTICLE_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"At most {settings.ARTICLE_BATCH_MAX_IDS} ids per batch"
+        )
+    if not requested:
+        return ArticleBatch()
+
+    try:
+        found = await db["articles"].find(
+            {"id": {"$in": requested}}, {**projection, "id": 1}
+        ).to_list(length=len(requested))
+    except Exception as e:
+        logger.exception(f"Error fetching article batch: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    by_id = {article["id"]: fill_article_defaults(article, projection) for article in found}
+    return ArticleBatch(
+        articles=[by_id[i] for i in requested if i in by_id],
+        missing=[i for i in requested if i not in by_id]
+    )
+
+@router.get("/providers/status", response_model=Dict[str, Dict[str, Any]])
+async def get_provider_status():
+    """
+    Gateway state of each provider called so far: circuit, rate tokens, quota used today
+    and how often it was skipped.
+    """
+    try:
+        return await provider_gateway.status()
+    except Exception as e:
+        logger.exception(f"Error reading provider status: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+# Declared before /{article_id}, which would otherwise match "batch"
+@router.get("/batch", response_model=ArticleBatch)
+async def read_article_batch(
+    ids: List[str] = Query(..., description="Article ids, repeated or comma-separated"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Get many articles by id with one query, e.g. a user's saved articles.
+    Articles come back in the order requested; unknown ids are listed in missing.
+    """
+    return await get_article_batch(db, ids, list_projection(fields))
+
+@router.post("/batch", response_model=ArticleBatch)
+async def read_article_batch_post(
+    batch: ArticleBatchRequest = Body(...),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Same as GET /articles/batch, for id lists too long for a query string.
+    """
+    return await get_article_batch(db, batch.ids, list_projection(fields))
 
 @router.get("/{article_id}", response_model=Article)
 async def read_article(
     article_id: str,
+    request: Request,
     db: AsyncIOMotorDatabase = Depends(get_database)
 ):
     """
     Get a specific article by ID.
     """
     try:
+        cache_key = article_cache.key("article", id=article_id)
+        cached = article_cache.get(cache_key)
+        if cached is not None:
+            return cached.to_response(request)
+        
         article = await db["articles"].find_one({"id": article_id})
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
+        fill_article_defaults(article)
         
-        # Ensure all required fields exist
-        if "title" not in article or not article["title"]:
-            article["title"] = "Untitled Article"
-        if "source" not in article or not article["source"]:
-            article["source"] = "Unknown Source"
-        if "source_url" not in article or not article["source_url"]:
-            article["source_url"] = "https://example.com"
-        if "published_date" not in article:
-            article["published_date"] = datetime.utcnow()
-        if "synopsis" not in article:
-            article["synopsis"] = ""
-        if "content" not in article:
-            article["content"] = ""
-            
-        return article
+        return article_cache.store(cache_key, article, Article).to_response(request)
     except HTTPException:
         raise
     except Exception as e:
@@ -199,10 +261,9 @@ async def create_article(
         
         article_dict = article.dict()
         
-        # Ensure published_date is a string if it's a datetime
-        if isinstance(article_dict.get("published_date"), datetime):
-            article_dict["published_date"] = article_dict["published_date"].isoformat()
-            
+        # Store published_date as naive UTC like ingested articles
+        article_dict["published_date"] = normalize_published_date(article_dict["published_date"])
+        
         article_in_db = {
             **article_dict,
             "id": article_id,
@@ -211,6 +272,7 @@ async def create_article(
         }
         
         await db["articles"].insert_one(article_in_db)
+        article_cache.invalidate()
         
         return article_in_db
     except Exception as e:
@@ -218,53 +280,37 @@ async def create_article(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/sources/list", response_model=List[Dict[str, Any]])
-async def get_sources():
+async def get_sources(request: Request):
     """
     Get information about available news sources.
     """
-    sources = [
-        {
-            "id": "newsapi",
-            "name": "NewsAPI.org",
-            "enabled": bool(settings.NEWSAPI_API_KEY),
-            "description": "Provides breaking news headlines and search for articles from over 80,000 sources.",
-            "categories": ["business", "entertainment", "general", "health", "science", "sports", "technology"]
-        },
-        {
-            "id": "gnews",
-            "name": "GNews API",
-            "enabled": bool(settings.GNEWS_API_KEY),
-            "description": "Searchable and real-time news data from various sources around the web.",
-            "categories": ["business", "entertainment", "health", "science", "sports", "technology", "world", "nation"]
-        },
-        {
-            "id": "guardian",
-            "name": "The Guardian",
-            "enabled": bool(settings.GUARDIAN_API_KEY),
-            "description": "Open platform for accessing Guardian content, providing a rich set of articles.",
-            "categories": ["business", "technology", "sport", "politics", "science", "society", "culture", "environment", "world"]
-        }
-    ]
+    cache_key = article_cache.key("sources")
+    cached = article_cache.get(cache_key)
+    if cached is not None:
+        return cached.to_response(request)
     
-    return sources
+    sources = provider_registry.sources()
+    
+    return article_cache.store(cache_key, sources, List[Dict[str, Any]]).to_response(request)
 
 @router.get("/categories/list", response_model=List[Dict[str, Any]])
-async def get_all_categories():
+async def get_all_categories(request: Request):
     """
     Get all available article categories from all sources.
     """
+    cache_key = article_cache.key("categories")
+    cached = article_cache.get(cache_key)
+    if cached is not None:
+        return cached.to_response(request)
+    
     # Combine categories from all sources
-    categories = [
-        {"id": "business", "name": "Business", "sources": ["newsapi", "gnews", "guardian"]},
-        {"id": "technology", "name": "Technology", "sources": ["newsapi", "gnews", "guardian"]},
-        {"id": "entertainment", "name": "Entertainment", "sources": ["newsapi", "gnews"]},
-        {"id": "health", "name": "Health", "sources": ["newsapi", "gnews"]},
-        {"id": "science", "name": "Science", "sources": ["newsapi", "gnews", "guardian"]},
-        {"id": "sports", "name": "Sports", "sources": ["newsapi", "gnews", "guardian"]},
-        {"id": "world", "name": "World", "sources": ["gnews", "guardian"]},
-        {"id": "politics", "name": "Politics", "sources": ["guardian"]},
-        {"id": "environment", "name": "Environment", "sources": ["guardian"]},
-        {"id": "culture", "name": "Culture", "sources": ["guardian"]},
-    ]
+    categories = provider_registry.categories()
     
-    return categories
\ No newline at end of file
+    return article_cache.store(cache_key, categories, List[Dict[str, Any]]).to_response(request)
+
+@router.get("/cache/stats", response_model=Dict[str, Any])
+async def get_cache_stats():
+    """
+    Hit/miss counters for the article response cache.
+    """
+    return article_cache.stats()
\ No newline at end of file
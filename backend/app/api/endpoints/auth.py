@@ -2,34 +2,52 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from datetime import timedelta
 from typing import Any
-from jose import jwt, JWTError
+from jose import JWTError
 from pydantic import ValidationError
 
 from ...core.config import settings
-from ...core.security import create_access_token, verify_password, get_password_hash
+from ...core.cache import TTLCache
+from ...core.security import create_access_token, decode_access_token, hash_password, verify_and_update_password
 from ...db.base import get_database
-from ...schemas.user import User, UserCreate, Token, TokenPayload, UserInDB
+from ...schemas.user import AuthUser, User, UserCreate, Token, TokenPayload, UserInDB
 import uuid
 from datetime import datetime
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db = Depends(get_database)):
+# Only the AuthUser fields; profile lists and the password hash stay in Mongo
+USER_AUTH_PROJECTION = {"_id": 0, **{field: 1 for field in AuthUser.model_fields}}
+
+user_cache = TTLCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_USER_CACHE_TTL_SECONDS)
+
+def invalidate_user_cache(user_id: str):
+    """
+    Call from every endpoint that changes a user's identity fields (email, name,
+    password) so the next request reloads them instead of waiting out the TTL
+    """
+    user_cache.pop(user_id)
+
+def get_token_user_id(token: str = Depends(oauth2_scheme)) -> str:
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode_access_token(token)
         token_data = TokenPayload(**payload)
     except (JWTError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = await db["users"].find_one({"id": token_data.sub})
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    return UserInDB(**user)
+    return token_data.sub
+
+async def get_current_user(user_id: str = Depends(get_token_user_id), db = Depends(get_database)) -> AuthUser:
+    """Resolve the bearer token to the user's identity, cached for AUTH_USER_CACHE_TTL_SECONDS"""
+    user = user_cache.get(user_id)
+    if user is None:
+        user = await db["users"].find_one({"id": user_id}, USER_AUTH_PROJECTION)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        user_cache.set(user_id, user)
+    return AuthUser(**user)
 
 @router.post("/register", response_model=User)
 async def register(user_in: UserCreate, db = Depends(get_database)):
@@ -47,7 +65,7 @@ async def register(user_in: UserCreate, db = Depends(get_database)):
         id=user_id,
         email=user_in.email,
         name=user_in.name,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await hash_password(user_in.password),
         created_at=created_at,
         updated_at=created_at
     )
@@ -99,11 +117,22 @@ async def login_access_token(
     db = Depends(get_database)
 ) -> Any:
     user = await db["users"].find_one({"email": form_data.username})
-    if not user or not verify_password(form_data.password, user["hashed_password"]):
+    valid, new_hash = (False, None)
+    if user:
+        valid, new_hash = await verify_and_update_password(form_data.password, user["hashed_password"])
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
         )
+
+    if new_hash:
+        # Stored hash predates the configured bcrypt cost; upgrade it while we have the password
+        await db["users"].update_one(
+            {"id": user["id"], "hashed_password": user["hashed_password"]},
+            {"$set": {"hashed_password": new_hash, "updated_at": datetime.utcnow()}}
+        )
+        invalidate_user_cache(user["id"])
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
@@ -114,5 +143,9 @@ async def login_access_token(
     }
 
 @router.get("/me", response_model=User)
-async def read_users_me(current_user: UserInDB = Depends(get_current_user)):
-    return current_user
\ No newline at end of file
+async def read_users_me(user_id: str = Depends(get_token_user_id), db = Depends(get_database)):
+    # The full profile in one read, including the lists AuthUser leaves out
+    user = await db["users"].find_one({"id": user_id}, {"_id": 0, "hashed_password": 0})
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
\ No newline at end of file
@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Query
+from typing import Any, Dict, List
+
+from ...core.tracing import recent_traces
+
+router = APIRouter()
+
+@router.get("/ingestion-runs", response_model=List[Dict[str, Any]])
+async def get_ingestion_runs(
+    limit: int = Query(10, ge=1, le=100),
+    spans: bool = Query(False, description="Include the individual spans of each run")
+):
+    """
+    The last ingestion runs, newest first: duration per stage, item, drop and duplicate
+    counts, and requests, bytes and articles per provider.
+    """
+    return [trace.to_dict(spans=spans) for trace in recent_traces("ingestion", limit)]
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List
+import logging
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from ...db.base import get_database
+from ...schemas.article import ArticleSummary
+from ...schemas.user import AuthUser
+from ...services.feed_service import read_feed, rebuild_feed
+from .auth import get_current_user
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+@router.get("/", response_model=List[ArticleSummary])
+async def get_feed(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: AuthUser = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    The current user's feed: the newest articles in their categories and in the categories
+    of articles they saved, newest first. Holds at most FEED_MAX_ITEMS articles.
+    """
+    try:
+        return await read_feed(db, current_user.id, skip, limit)
+    except Exception as e:
+        logger.exception(f"Error reading feed for user {current_user.id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.post("/rebuild", response_model=List[ArticleSummary])
+async def rebuild_user_feed(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: AuthUser = Depends(get_current_user),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Rebuild the current user's feed after their categories or saved articles change,
+    returning its first page.
+    """
+    try:
+        feed = await rebuild_feed(db, current_user.id)
+        return feed["items"][:limit]
+    except Exception as e:
+        logger.exception(f"Error rebuilding feed for user {current_user.id}: {str(e)}")
+        raise HTTPException(status_code=500, detail="Internal server error")
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from typing import Any, Dict, List
+import asyncio
+import logging
+
+from ...core.config import settings
+from ...core.profiling import PSTATS_SORT_KEYS, event_loop_thread_id, profiler, render_collapsed, sample_stacks
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+@router.get("/sample", response_class=PlainTextResponse)
+async def sample_event_loop(
+    seconds: float = Query(10.0, gt=0),
+    interval_ms: float = Query(5.0, ge=1, le=1000)
+):
+    """
+    Sample the event loop thread's stack every interval_ms for seconds and return the
+    collapsed stacks ("frame;frame;frame count" lines) for flamegraph.pl or speedscope.
+    The loop keeps serving requests while it is sampled.
+    """
+    if seconds > settings.PROFILING_MAX_SECONDS:
+        raise HTTPException(status_code=400, detail=f"seconds must be at most {settings.PROFILING_MAX_SECONDS}")
+    if profiler.sampling:
+        raise HTTPException(status_code=409, detail="A sample is already running")
+
+    profiler.sampling = True
+    try:
+        logger.info(f"Sampling the event loop for {seconds}s every {interval_ms}ms")
+        stacks = await asyncio.to_thread(sample_stacks, event_loop_thread_id(), seconds, interval_ms / 1000)
+    finally:
+        profiler.sampling = False
+    return PlainTextResponse(render_collapsed(stacks), headers={"X-Samples": str(sum(stacks.values()))})
+
+@router.get("/requests", response_model=List[Dict[str, Any]])
+async def list_request_profiles():
+    """Requests profiled with X-Profile: 1, newest first"""
+    return [capture.summary() for capture in profiler.recent()]
+
+@router.get("/requests/{profile_id}", response_class=PlainTextResponse)
+async def get_request_profile(
+    profile_id: str,
+    sort: str = Query("cumulative", description=f"One of {', '.join(PSTATS_SORT_KEYS)}"),
+    limit: int = Query(50, ge=1, le=1000)
+):
+    """pstats report of a profiled request, named by its X-Profile-Id response header"""
+    if sort not in PSTATS_SORT_KEYS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(PSTATS_SORT_KEYS)}")
+    capture = profiler.find(profile_id)
+    if capture is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(capture.render(sort, limit))
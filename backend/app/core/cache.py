@@ -0,0 +1,131 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from .config import settings
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache whose entries also expire after ttl seconds.
+    Not thread-safe; meant to be used from the event loop only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class CachedResponse:
+    """A serialized JSON response body with its ETag and extra headers"""
+
+    def __init__(self, body: bytes, headers: Optional[Dict[str, str]] = None):
+        self.body = body
+        self.etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        self.headers = headers or {}
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(tag.replace("W/", "", 1) == self.etag for tag in tags)
+
+    def to_response(self, request: Request) -> Response:
+        headers = {**self.headers, "ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.matches(request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+class ResponseCache(TTLCache):
+    """
+    Cache of serialized read-endpoint responses. Keys include a generation
+    counter that ingestion bumps, so a write makes every older entry unreachable
+    at once (they then age out through LRU/TTL). Each process has its own cache,
+    so other replicas see new articles once their entries expire.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize, ttl)
+        self.generation = 0
+        self._adapters: Dict[Any, TypeAdapter] = {}
+
+    def key(self, endpoint: str, **params: Any) -> tuple:
+        normalized = tuple(sorted(
+            (name, tuple(sorted(value)) if isinstance(value, (list, set, tuple)) else value)
+            for name, value in params.items()
+        ))
+        return (self.generation, endpoint, normalized)
+
+    def invalidate(self):
+        self.generation += 1
+
+    def store(
+        self,
+        key: tuple,
+        content: Any,
+        response_model: Any,
+        headers: Optional[Dict[str, str]] = None
+    ) -> CachedResponse:
+        """Serialize content through response_model and cache it under key"""
+        adapter = self._adapters.get(response_model)
+        if adapter is None:
+            adapter = self._adapters[response_model] = TypeAdapter(response_model)
+        cached = CachedResponse(adapter.dump_json(adapter.validate_python(content)), headers)
+        self.set(key, cached)
+        return cached
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "generation": self.generation}
+
+
+article_cache = ResponseCache(
+    maxsize=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+)
@@ -1,6 +1,6 @@
 from pydantic import AnyHttpUrl, validator
 from pydantic_settings import BaseSettings
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 import os
 from dotenv import load_dotenv
 
@@ -12,10 +12,42 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY", "temporary_secret_key_change_in_production")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+    # bcrypt cost for new hashes; older hashes are upgraded on the next login
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 8
+    # Per-process caches of verified tokens and authorized users
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_TOKEN_CACHE_TTL_SECONDS: float = 300.0
+    AUTH_USER_CACHE_TTL_SECONDS: float = 30.0
     
     # Database
     MONGODB_URL: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
     DATABASE_NAME: str = "mynews"
+    # Expire articles this many days after ingestion (0 keeps them forever)
+    ARTICLE_TTL_DAYS: int = 0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+
+    # "mongo" uses the weighted text index; "memory" an in-process inverted index (tests, mongomock)
+    SEARCH_BACKEND: str = "mongo"
+    # How often the memory backend checks for deleted articles
+    SEARCH_MEMORY_RECONCILE_SECONDS: float = 60.0
+
+    # Prometheus metrics at GET /metrics (HTTP and MongoDB command timings)
+    METRICS_ENABLED: bool = True
+
+    # On-demand profiling under /debug/profile, sent with an X-Admin-Token header.
+    # Nothing is mounted or installed unless the token is set. The same token guards
+    # /debug/ingestion-runs.
+    PROFILING_ADMIN_TOKEN: str = os.getenv("PROFILING_ADMIN_TOKEN", "")
+    PROFILING_MAX_SECONDS: float = 60.0
+    PROFILING_KEEP_REQUESTS: int = 20
+
+    # In-process response cache for hot article reads
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    RESPONSE_CACHE_TTL_SECONDS: float = 60.0
+    # Most ids one GET/POST /articles/batch call resolves
+    ARTICLE_BATCH_MAX_IDS: int = 500
     
     # CORS
     # We'll handle this as a comma-separated string in the environment
@@ -42,7 +74,102 @@ class Settings(BaseSettings):
     CYBER_SECURITY_API_KEY: Optional[str] = os.getenv("CYBER_SECURITY_API_KEY", "")
     API_SECURITY_API_KEY: Optional[str] = os.getenv("API_SECURITY_API_KEY", "")
     THREAT_INTEL_API_KEY: Optional[str] = os.getenv("THREAT_INTEL_API_KEY", "")
-    
+
+    # Outbound HTTP (shared provider clients)
+    # Per-provider overrides are JSON objects in the environment, e.g. {"guardian": 15}
+    HTTP_TIMEOUT: float = 10.0
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_MAX_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 60.0
+    HTTP_PROVIDER_TIMEOUTS: Dict[str, float] = {"newsapi": 10.0, "gnews": 10.0, "guardian": 10.0, "mediastack": 10.0}
+    HTTP_PROVIDER_MAX_CONNECTIONS: Dict[str, int] = {"rss": 32}
+
+    # Provider gateway: token-bucket rate (requests/sec), daily quotas and circuit breaking.
+    # Providers missing from PROVIDER_RATE_LIMITS / PROVIDER_DAILY_QUOTAS are not limited.
+    PROVIDER_RATE_LIMITS: Dict[str, float] = {"newsapi": 0.5, "gnews": 1.0, "guardian": 1.0, "mediastack": 0.5}
+    PROVIDER_RATE_BURST: int = 5
+    PROVIDER_RATE_MAX_WAIT_SECONDS: float = 2.0
+    PROVIDER_DAILY_QUOTAS: Dict[str, int] = {"newsapi": 100, "gnews": 100, "guardian": 5000, "mediastack": 16}
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = 3
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS: float = 300.0
+
+    # Provider fan-out: one request per category (per page), this many in flight per provider
+    PROVIDER_DEFAULT_FETCH_CONCURRENCY: int = 2
+    PROVIDER_FETCH_CONCURRENCY: Dict[str, int] = {"guardian": 4, "rss": 32}
+    PROVIDER_MAX_PAGES: Dict[str, int] = {"newsapi": 2, "gnews": 1, "guardian": 2, "mediastack": 1}
+    # Retries for transport errors and 5xx, with exponential backoff
+    PROVIDER_RETRIES: int = 1
+    PROVIDER_RETRY_BACKOFF_SECONDS: float = 0.5
+
+    # Key-free RSS/Atom feeds, a JSON list in the environment:
+    # [{"url": "https://example.com/feed.xml", "categories": ["technology"], "name": "Example"}]
+    # Scheduled ingestion polls a feed for its categories listed in INGESTION_CATEGORIES.
+    RSS_FEEDS: List[Dict[str, Any]] = []
+    RSS_MAX_ENTRIES_PER_FEED: int = 50
+    RSS_MAX_BYTES: int = 5 * 1024 * 1024
+
+    # Background ingestion
+    INGESTION_ENABLED: bool = True
+    INGESTION_INTERVAL_SECONDS: int = 900
+    INGESTION_JITTER_SECONDS: int = 60
+    INGESTION_CATEGORIES: List[str] = [
+        "business", "technology", "science", "health",
+        "sports", "entertainment", "world", "politics"
+    ]
+    INGESTION_LEASE_SECONDS: int = 120
+    # First retry delay of a failed scheduled target; doubles per failure up to the interval
+    INGESTION_RETRY_BACKOFF_SECONDS: int = 30
+    REFRESH_MAX_WAIT_SECONDS: float = 5.0
+    # Traces of the last runs for /debug/ingestion-runs; TRACE_LOG_JSON also logs a JSON line per run
+    TRACE_BUFFER_SIZE: int = 50
+    TRACE_MAX_SPANS: int = 500
+    TRACE_LOG_JSON: bool = False
+
+    # Per-user feeds, fanned out at ingestion to users following an article's categories
+    FEED_ENABLED: bool = True
+    FEED_MAX_ITEMS: int = 500
+    FEED_SAVED_ARTICLES_SCANNED: int = 100
+    FEED_SAVED_CATEGORY_LIMIT: int = 3
+    FEED_FANOUT_BATCH_SIZE: int = 1000
+
+    # Near-duplicate clustering (MinHash + LSH over title and synopsis)
+    DEDUP_NUM_PERM: int = 64
+    DEDUP_BANDS: int = 16
+    DEDUP_SIMILARITY_THRESHOLD: float = 0.5
+    DEDUP_WINDOW_HOURS: int = 72
+    # How far back each incremental index sync re-reads, for writes committed out of order
+    DEDUP_SYNC_OVERLAP_SECONDS: int = 60
+
+    # AI tagging ("keywords" is TF-IDF; "zero-shot" loads TAGGING_MODEL with transformers)
+    TAGGING_ENABLED: bool = True
+    TAGGING_BACKEND: str = "keywords"
+    TAGGING_MODEL: str = "facebook/bart-large-mnli"
+    TAGGING_LABELS: List[str] = [
+        "politics", "business", "technology", "science", "health", "sports",
+        "entertainment", "environment", "security", "finance", "world"
+    ]
+    TAGGING_MIN_SCORE: float = 0.5
+    TAGGING_MAX_TAGS: int = 5
+    TAGGING_BATCH_SIZE: int = 64
+    TAGGING_WORKERS: int = 1
+    # Scheduled runs only tag articles published in the last N days (0 = no limit);
+    # backfill older ones with python -m app.services.tagging_service
+    TAGGING_MAX_AGE_DAYS: int = 7
+
+    # Summarization ("textrank" is extractive; "transformer" loads SUMMARIZATION_MODEL)
+    SUMMARIZATION_ENABLED: bool = True
+    SUMMARIZATION_BACKEND: str = "textrank"
+    SUMMARIZATION_MODEL: str = "sshleifer/distilbart-cnn-12-6"
+    SUMMARIZATION_SENTENCES: int = 3
+    SUMMARIZATION_MIN_CHARS: int = 400
+    SUMMARIZATION_WORKERS: int = 2
+    SUMMARIZATION_QUEUE_SIZE: int = 16
+    SUMMARIZATION_MAX_ATTEMPTS: int = 3
+    # A failed job waits this long before its next attempt, doubling per attempt
+    SUMMARIZATION_RETRY_BACKOFF_SECONDS: int = 60
+    SUMMARIZATION_LEASE_SECONDS: int = 300
+    SUMMARIZATION_POLL_SECONDS: float = 30.0
+
     # OpenAI API
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     
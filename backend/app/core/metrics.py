@@ -0,0 +1,213 @@
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Prometheus text exposition format 0.0.4 (Starlette appends the utf-8 charset)
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+HTTP_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """
+    A metric family with optional labels. Values are updated from the event loop and
+    from pymongo's monitoring threads, so every update takes the metric's lock.
+    """
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labelvalues: Sequence[str]) -> Tuple[str, ...]:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        return tuple(str(v) for v in labelvalues)
+
+    def _labels(self, key: Tuple[str, ...], **extra: str) -> Dict[str, str]:
+        return {**dict(zip(self.labelnames, key)), **extra}
+
+    @abstractmethod
+    def samples(self) -> Iterator[Sample]:
+        """(sample name, labels, value) for every series of the metric"""
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        for name, labels, value in self.samples():
+            label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_text}}} {_format_value(value)}" if label_text
+                         else f"{name} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        key = self._key(labelvalues)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield self.name, self._labels(key), value
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def dec(self, *labelvalues: str, amount: float = 1.0):
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, value: float, *labelvalues: str):
+        key = self._key(labelvalues)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = HTTP_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (last one is +Inf), sum, count
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labelvalues: str):
+        key = self._key(labelvalues)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            values = sorted((key, (list(counts), total[0])) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", self._labels(key, le=_format_value(bound)), cumulative
+            yield f"{self.name}_sum", self._labels(key), total
+            yield f"{self.name}_count", self._labels(key), cumulative
+
+
+class MetricsRegistry:
+    """
+    Metrics rendered by GET /metrics. Collectors are called on every scrape and return
+    freshly built metrics for state that lives elsewhere (cache stats, circuit states).
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Metric]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = HTTP_LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[Metric]]):
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for metric in collector():
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+http_requests_total = metrics_registry.counter(
+    "http_requests_total", "HTTP requests by route template, method and status code",
+    ("method", "route", "status")
+)
+http_request_duration_seconds = metrics_registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template and method",
+    ("method", "route")
+)
+http_requests_in_flight = metrics_registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served"
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware timing every HTTP request. Requests are labelled with the
+    matched route's path template ("/api/v1/articles/{article_id}"), never the raw
+    path, so ids don't create new series; unmatched paths share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status: Optional[int] = None
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status = 500
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            # The router records the matched route in the scope it was handed
+            route = scope.get("route")
+            route_label = getattr(route, "path_format", None) or getattr(route, "path", None) or "unmatched"
+            http_request_duration_seconds.observe(elapsed, scope["method"], route_label)
+            http_requests_total.inc(scope["method"], route_label, str(status or 500))
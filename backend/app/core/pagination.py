@@ -0,0 +1,54 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from fastapi import HTTPException
+
+# Listing order shared by every cursor-paginated endpoint; id breaks ties
+ARTICLE_SORT = [("published_date", -1), ("id", -1)]
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(published_date: Union[datetime, str], article_id: str) -> str:
+    """Opaque cursor for the (published_date, id) position of the last returned article"""
+    if isinstance(published_date, datetime):
+        payload = {"d": published_date.isoformat(), "t": "dt", "i": article_id}
+    else:
+        payload = {"d": published_date, "t": "s", "i": article_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Union[datetime, str], str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        published_date = payload["d"]
+        if payload.get("t") == "dt":
+            published_date = datetime.fromisoformat(published_date)
+        return published_date, str(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def cursor_filter(cursor: str) -> Dict[str, Any]:
+    """Filter matching the articles that sort after the cursor position"""
+    published_date, article_id = decode_cursor(cursor)
+    return {
+        "$or": [
+            {"published_date": {"$lt": published_date}},
+            {"published_date": published_date, "id": {"$lt": article_id}},
+        ]
+    }
+
+
+def next_cursor(articles: List[Dict[str, Any]], limit: int) -> Optional[str]:
+    """Cursor for the following page, or None when this page was the last"""
+    if not articles or len(articles) < limit:
+        return None
+    last = articles[-1]
+    if "published_date" not in last or "id" not in last:
+        return None
+    return encode_cursor(last["published_date"], last["id"])
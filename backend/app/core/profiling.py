@@ -0,0 +1,161 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional
+
+from .config import settings
+from .security import ADMIN_TOKEN_HEADER, is_admin_token
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+PSTATS_SORT_KEYS = ("cumulative", "tottime", "calls", "pcalls", "filename", "name")
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}:{code.co_firstlineno}"
+
+
+def collapse_stack(frame) -> str:
+    """A thread's stack as one collapsed line, outermost frame first ("a;b;c")"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def sample_stacks(thread_id: int, seconds: float, interval: float) -> Counter:
+    """
+    Sample another thread's stack every interval for seconds, from the calling thread.
+    Nothing is hooked into the sampled thread, so it runs at full speed in between.
+    """
+    stacks: Counter = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            stacks[collapse_stack(frame)] += 1
+        del frame
+        time.sleep(interval)
+    return stacks
+
+
+def render_collapsed(stacks: Counter) -> str:
+    """Brendan Gregg's collapsed format, as read by flamegraph.pl and speedscope"""
+    return "".join(f"{stack} {samples}\n" for stack, samples in stacks.most_common())
+
+
+class RequestProfile:
+    """cProfile capture of one request sent with X-Profile: 1"""
+
+    def __init__(self, profile_id: str, method: str, path: str, profile: cProfile.Profile):
+        self.id = profile_id
+        self.method = method
+        self.path = path
+        self.profile = profile
+        self.created_at = datetime.utcnow()
+        self.status: Optional[int] = None
+        self.duration: float = 0.0
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "duration_ms": round(self.duration * 1000, 2),
+            "created_at": self.created_at.isoformat(),
+        }
+
+    def render(self, sort: str = "cumulative", limit: int = 50) -> str:
+        stream = io.StringIO()
+        pstats.Stats(self.profile, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+class Profiler:
+    """
+    Holds the state of on-demand profiling: whether a stack sample or a request
+    capture is running (one of each at a time) and the last captured requests.
+    """
+
+    def __init__(self):
+        self.sampling = False
+        self.capturing = False
+        self.requests: Deque[RequestProfile] = deque(maxlen=settings.PROFILING_KEEP_REQUESTS)
+
+    def find(self, profile_id: str) -> Optional[RequestProfile]:
+        return next((p for p in self.requests if p.id == profile_id), None)
+
+    def recent(self) -> List[RequestProfile]:
+        return list(reversed(self.requests))
+
+
+profiler = Profiler()
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a request with cProfile when it carries X-Profile: 1 and the admin token.
+    The response gets an X-Profile-Id header naming the capture. cProfile sees everything
+    the event loop thread runs meanwhile, so captures are clearest on a quiet replica.
+    Only installed when PROFILING_ADMIN_TOKEN is set.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope) or profiler.capturing:
+            await self.app(scope, receive, send)
+            return
+
+        capture = RequestProfile(uuid.uuid4().hex[:12], scope["method"], scope["path"], cProfile.Profile())
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                capture.status = message["status"]
+                message = {**message, "headers": list(message.get("headers", [])) + [
+                    (PROFILE_ID_HEADER, capture.id.encode())
+                ]}
+            await send(message)
+
+        try:
+            capture.profile.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger's) owns the interpreter hook
+            await self.app(scope, receive, send)
+            return
+
+        profiler.capturing = True
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            capture.profile.disable()
+            capture.duration = time.perf_counter() - started
+            profiler.capturing = False
+            profiler.requests.append(capture)
+
+    @staticmethod
+    def _requested(scope) -> bool:
+        profile = token = None
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                profile = value
+            elif name == b"x-admin-token":
+                token = value.decode("latin-1")
+        return profile == b"1" and is_admin_token(token)
+
+
+def event_loop_thread_id() -> int:
+    """Call from a coroutine: the id of the thread running the event loop"""
+    return threading.get_ident()
@@ -1,10 +1,26 @@
+import asyncio
+import logging
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from fastapi import Header, HTTPException
 from jose import jwt
 from passlib.context import CryptContext
+from ..core.cache import TTLCache
 from ..core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
+
+# Hashes made with a different cost report needs_update() and are upgraded on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__default_rounds=settings.BCRYPT_ROUNDS
+)
+
+# Verified token -> claims, so repeat requests with the same token skip signature checks
+token_cache = TTLCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_TOKEN_CACHE_TTL_SECONDS)
 
 def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     if expires_delta:
@@ -17,8 +33,122 @@ def create_access_token(subject: Union[str, Any], expires_delta: Optional[timede
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """Admin routes are off unless PROFILING_ADMIN_TOKEN is set, and then require that token"""
+    expected = settings.PROFILING_ADMIN_TOKEN
+    # compare_digest only accepts ASCII str, so compare the encoded bytes
+    return bool(expected) and bool(token) and secrets.compare_digest(token.encode("utf-8"), expected.encode("utf-8"))
+
+async def require_admin(x_admin_token: Optional[str] = Header(None, alias=ADMIN_TOKEN_HEADER)):
+    """Dependency for operator-only routes (/debug, /debug/profile)"""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated thread pool so hashing never blocks the event loop.
+    A semaphore caps the calls in flight, so a login burst queues here instead of
+    piling work onto the executor, and the time spent queued is recorded.
+    """
+
+    def __init__(self, workers: int, max_concurrency: int):
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Guards the timing counters, which the pool threads update concurrently
+        self._stats_lock = threading.Lock()
+        self.calls = 0
+        self.in_flight = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.hash_seconds_total = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        queued = time.perf_counter()
+        async with self._get_semaphore():
+            self.in_flight += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), self._timed, queued, func, *args
+                )
+            finally:
+                self.in_flight -= 1
+
+    def _timed(self, queued: float, func: Callable, *args: Any) -> Any:
+        started = time.perf_counter()
+        wait = started - queued
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._stats_lock:
+                self.calls += 1
+                self.wait_seconds_total += wait
+                self.wait_seconds_max = max(self.wait_seconds_max, wait)
+                self.hash_seconds_total += elapsed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "workers": self.workers,
+                "max_concurrency": self.max_concurrency,
+                "rounds": settings.BCRYPT_ROUNDS,
+                "calls": self.calls,
+                "in_flight": self.in_flight,
+                "queue_wait_seconds_total": round(self.wait_seconds_total, 6),
+                "queue_wait_seconds_max": round(self.wait_seconds_max, 6),
+                "queue_wait_seconds_avg": round(self.wait_seconds_total / self.calls, 6) if self.calls else 0.0,
+                "hash_seconds_avg": round(self.hash_seconds_total / self.calls, 6) if self.calls else 0.0,
+            }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY
+)
+
+async def hash_password(password: str) -> str:
+    return await password_hasher.run(pwd_context.hash, password)
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify off the event loop. The second value is a replacement hash when the
+    stored one uses an outdated scheme or cost, otherwise None.
+    """
+    return await password_hasher.run(pwd_context.verify_and_update, plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
\ No newline at end of file
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """
+    Verify a token and return its claims. Raises jose.JWTError when invalid.
+    Results are cached, but never beyond the token's own expiry.
+    """
+    claims = token_cache.get(token)
+    if claims is not None:
+        if claims.get("exp") is None or claims["exp"] > time.time():
+            return claims
+        token_cache.pop(token)
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    ttl = settings.AUTH_TOKEN_CACHE_TTL_SECONDS
+    if claims.get("exp") is not None:
+        ttl = min(ttl, claims["exp"] - time.time())
+    if ttl > 0:
+        token_cache.set(token, claims, ttl=ttl)
+    return claims
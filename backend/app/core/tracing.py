@@ -0,0 +1,141 @@
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Trace:
+    """
+    Timings and counters for one run (e.g. an ingestion run). Spans are aggregated per
+    stage name; the individual spans are kept up to TRACE_MAX_SPANS.
+    """
+
+    def __init__(self, name: str, **attributes: Any):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.attributes = attributes
+        self.started_at = datetime.utcnow()
+        self.status = "running"
+        self.error: Optional[str] = None
+        self.duration: Optional[float] = None
+        self.spans: List[Dict[str, Any]] = []
+        self.dropped_spans = 0
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counts: Dict[str, float] = defaultdict(int)
+        self.providers: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(int))
+        self._started = time.perf_counter()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    def add_span(self, name: str, started: float, duration: float, attributes: Dict[str, Any]):
+        stage = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0})
+        stage["calls"] += 1
+        stage["seconds"] += duration
+        stage["max_seconds"] = max(stage["max_seconds"], duration)
+        if len(self.spans) >= settings.TRACE_MAX_SPANS:
+            self.dropped_spans += 1
+            return
+        self.spans.append({
+            "name": name,
+            "start_ms": round((started - self._started) * 1000, 2),
+            "duration_ms": round(duration * 1000, 2),
+            **({"attributes": attributes} if attributes else {}),
+        })
+
+    def count(self, name: str, amount: float = 1, provider: Optional[str] = None):
+        if provider:
+            self.providers[provider][name] += amount
+        else:
+            self.counts[name] += amount
+
+    def to_dict(self, spans: bool = True) -> Dict[str, Any]:
+        data = {
+            "id": self.id,
+            "name": self.name,
+            "attributes": self.attributes,
+            "started_at": self.started_at.isoformat(),
+            "status": self.status,
+            "error": self.error,
+            "duration_seconds": round(self.duration if self.duration is not None else self.elapsed(), 4),
+            "stages": {
+                name: {**stage, "seconds": round(stage["seconds"], 4), "max_seconds": round(stage["max_seconds"], 4)}
+                for name, stage in self.stages.items()
+            },
+            "counts": dict(self.counts),
+            "providers": {provider: dict(counts) for provider, counts in self.providers.items()},
+        }
+        if spans:
+            data["spans"] = self.spans
+            data["dropped_spans"] = self.dropped_spans
+        return data
+
+
+# The run being traced in this context; asyncio tasks started inside a run inherit it
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+
+# Finished runs, newest last
+trace_buffer: Deque[Trace] = deque(maxlen=settings.TRACE_BUFFER_SIZE)
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def start_trace(name: str, **attributes: Any) -> Iterator[Trace]:
+    """Trace a run: spans and counts recorded inside the block (and its tasks) land on it"""
+    trace = Trace(name, **attributes)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+        trace.status = "ok"
+    except BaseException as e:
+        trace.status = "error"
+        trace.error = str(e) or type(e).__name__
+        raise
+    finally:
+        _current_trace.reset(token)
+        trace.duration = trace.elapsed()
+        trace_buffer.append(trace)
+        if settings.TRACE_LOG_JSON:
+            logger.info(json.dumps({"trace": trace.to_dict(spans=False)}, default=str))
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time a stage of the current run. Yields the span's attributes so the block can add
+    results (e.g. item counts). Outside a traced run this only yields.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        yield attributes
+        return
+    started = time.perf_counter()
+    try:
+        yield attributes
+    finally:
+        trace.add_span(name, started, time.perf_counter() - started, attributes)
+
+
+def count(name: str, amount: float = 1, provider: Optional[str] = None):
+    """Add to a counter of the current run, overall or per provider; a no-op outside a run"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.count(name, amount, provider)
+
+
+def recent_traces(name: Optional[str] = None, limit: int = 10) -> List[Trace]:
+    """Finished runs, newest first"""
+    traces = [trace for trace in reversed(trace_buffer) if name is None or trace.name == name]
+    return traces[:limit]
@@ -0,0 +1,152 @@
+import logging
+from typing import Any, Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure, PyMongoError
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Relative field weights, shared by the Mongo text index and the in-memory search index
+SEARCH_WEIGHTS = {"title": 10, "synopsis": 4, "content": 1}
+
+DUPLICATE_KEY_ERROR = 11000
+
+# Options that must match for an existing index to count as the declared one
+COMPARED_OPTIONS = ("unique", "sparse", "expireAfterSeconds", "weights")
+
+
+def declared_indexes() -> Dict[str, List[IndexModel]]:
+    """
+    Indexes every collection should have, keyed by collection name.
+    Indexes use pymongo's default names (e.g. "categories_1_published_date_-1"),
+    which is what drift detection matches on.
+    """
+    articles = [
+        IndexModel([("id", ASCENDING)], unique=True),
+        IndexModel([("source_url", ASCENDING)], unique=True),
+        # Filter-plus-sort patterns from read_articles and get_latest_articles
+        # (id breaks published_date ties for keyset pagination)
+        IndexModel([("published_date", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("categories", ASCENDING), ("published_date", DESCENDING), ("id", DESCENDING)]),
+        IndexModel([("source", ASCENDING), ("published_date", DESCENDING), ("id", DESCENDING)]),
+        # Cluster lookups for near-duplicate stories
+        IndexModel([("cluster_id", ASCENDING)]),
+        # Copying memoized summaries onto every article with the same body
+        IndexModel([("content_hash", ASCENDING)]),
+        # Recently published untagged articles ({"tagged_at": None}) for the tagging service
+        IndexModel([("tagged_at", ASCENDING), ("published_date", ASCENDING)]),
+        # Weighted full-text search (title > synopsis > content)
+        IndexModel(
+            [(field, TEXT) for field in SEARCH_WEIGHTS],
+            weights=SEARCH_WEIGHTS,
+            name="article_text"
+        ),
+    ]
+    # Also serves the near-duplicate index reload, which scans recent created_at
+    if settings.ARTICLE_TTL_DAYS > 0:
+        articles.append(IndexModel(
+            [("created_at", ASCENDING)],
+            expireAfterSeconds=settings.ARTICLE_TTL_DAYS * 24 * 60 * 60
+        ))
+    else:
+        articles.append(IndexModel([("created_at", ASCENDING)]))
+
+    return {
+        "articles": articles,
+        "users": [
+            IndexModel([("id", ASCENDING)], unique=True),
+            IndexModel([("email", ASCENDING)], unique=True),
+        ],
+        "summarization_jobs": [
+            IndexModel([("status", ASCENDING), ("created_at", ASCENDING)]),
+        ],
+        "categories": [
+            IndexModel([("user_id", ASCENDING), ("order", ASCENDING)]),
+            IndexModel([("slug", ASCENDING)]),
+        ],
+        # Feeds are read by _id; fan-out finds the feeds following an article's categories
+        "user_feeds": [
+            IndexModel([("interests", ASCENDING)]),
+        ],
+    }
+
+
+def _describe(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize an index spec (declared or from index_information) for comparison"""
+    key = spec["key"]
+    if hasattr(key, "items"):
+        key = list(key.items())
+    key = [(field, int(direction) if isinstance(direction, (int, float)) else direction)
+           for field, direction in key]
+    if any(field == "_fts" or direction == TEXT for field, direction in key):
+        # Mongo reports text indexes as _fts/_ftsx; their fields live in "weights"
+        key = TEXT
+    return {
+        "key": key,
+        **{option: spec[option] for option in COMPARED_OPTIONS if spec.get(option)},
+    }
+
+
+async def _report_drift(collection, declared: List[IndexModel]):
+    existing = await collection.index_information()
+    declared_by_name = {model.document["name"]: model.document for model in declared}
+
+    for name, spec in declared_by_name.items():
+        current = existing.get(name)
+        if current is None:
+            logger.info(f"Index {collection.name}.{name} missing; creating it")
+        elif _describe(current) != _describe(spec):
+            logger.warning(
+                f"Index drift on {collection.name}.{name}: "
+                f"declared {_describe(spec)}, existing {_describe(current)}"
+            )
+
+    for name in existing:
+        if name != "_id_" and name not in declared_by_name:
+            logger.warning(f"Undeclared index {collection.name}.{name}: {_describe(existing[name])}")
+
+
+async def _report_duplicates(collection, model: IndexModel):
+    """Explain a failed unique index build by listing the values held by several documents"""
+    fields = [field for field, _ in model.document["key"].items()]
+    group_id = {field: f"${field}" for field in fields}
+    pipeline = [
+        {"$group": {"_id": group_id, "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": 1}}},
+    ]
+    duplicates = await collection.aggregate(pipeline).to_list(length=None)
+    examples = ", ".join(f"{d['_id']} x{d['count']}" for d in duplicates[:5])
+    logger.error(
+        f"Unique index {collection.name}.{model.document['name']} not created: "
+        f"{len(duplicates)} values of {'/'.join(fields)} are shared by several documents "
+        f"(e.g. {examples}). Merge or delete the duplicates and restart to create it; "
+        f"until then the field is not enforced as unique."
+    )
+
+
+async def ensure_indexes(database: AsyncIOMotorDatabase):
+    """
+    Create every declared index. Safe to run on each startup: existing indexes
+    are left alone and conflicts are logged rather than dropped.
+    """
+    for collection_name, models in declared_indexes().items():
+        collection = database[collection_name]
+        try:
+            await _report_drift(collection, models)
+        except PyMongoError as e:
+            logger.warning(f"Could not inspect indexes on {collection_name}: {e}")
+
+        # One at a time so a conflicting index doesn't block the others
+        for model in models:
+            try:
+                await collection.create_indexes([model])
+            except OperationFailure as e:
+                if e.code == DUPLICATE_KEY_ERROR and model.document.get("unique"):
+                    await _report_duplicates(collection, model)
+                else:
+                    logger.error(f"Could not create index {collection_name}.{model.document['name']}: {e}")
+            except PyMongoError as e:
+                logger.error(f"Index creation on {collection_name} failed: {e}")
+                break
@@ -0,0 +1,138 @@
+"""
+One-off data migrations. Run from the backend directory, e.g.:
+
+    python -m app.db.migrations backfill_legacy_articles
+"""
+import asyncio
+import logging
+import sys
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from ..core.config import settings
+from ..services.providers import normalize_published_date
+
+logger = logging.getLogger(__name__)
+
+
+def _inserted_at(doc: Dict[str, Any]) -> datetime:
+    """When a legacy document was first written, going by its ObjectId"""
+    if isinstance(doc.get("_id"), ObjectId):
+        return doc["_id"].generation_time.replace(tzinfo=None)
+    return datetime.utcnow()
+
+
+def _legacy_id(doc: Dict[str, Any]) -> str:
+    return str(doc["_id"]) if "_id" in doc else str(uuid.uuid4())
+
+
+# Fields the response models require that legacy documents may lack. Callables get the
+# document (with the fixes so far applied), so later defaults can build on earlier ones.
+ARTICLE_FIELD_DEFAULTS = {
+    "id": _legacy_id,
+    "title": "Untitled Article",
+    "source": "Unknown Source",
+    "synopsis": "",
+    "content": "",
+    # source_url has a unique index, so every document needs its own placeholder
+    "source_url": lambda doc: f"legacy:{doc['id']}",
+    "created_at": _inserted_at,
+    "updated_at": lambda doc: doc["created_at"],
+}
+
+
+def _article_fixes(doc: Dict[str, Any]) -> Dict[str, Any]:
+    fixes = {}
+    published_date = doc.get("published_date")
+    if not isinstance(published_date, datetime) or published_date.tzinfo is not None:
+        fixes["published_date"] = normalize_published_date(
+            published_date, default=doc.get("created_at") or _inserted_at(doc)
+        )
+    for field, default in ARTICLE_FIELD_DEFAULTS.items():
+        if doc.get(field) is None:
+            fixes[field] = default({**doc, **fixes}) if callable(default) else default
+    return fixes
+
+
+def fill_article_defaults(article: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Patch a legacy article in place as it is read, so it validates before
+    backfill_legacy_articles has run. Only fields in fields (e.g. a projection's keys)
+    are filled, so list responses don't grow fields they didn't ask for.
+    """
+    fixes = _article_fixes(article)
+    if fields is not None:
+        wanted = set(fields)
+        fixes = {field: value for field, value in fixes.items() if field in wanted}
+    article.update(fixes)
+    return article
+
+
+async def _write_batch(database: AsyncIOMotorDatabase, batch: List[UpdateOne]) -> int:
+    """Apply one batch of fixes; write errors are logged and the rest of the batch still lands"""
+    try:
+        result = await database["articles"].bulk_write(batch, ordered=False)
+        return result.modified_count
+    except BulkWriteError as e:
+        details = e.details
+        write_errors = details.get("writeErrors", [])
+        for error in write_errors[:5]:
+            logger.error(f"Error backfilling article: {error.get('errmsg')}")
+        logger.error(f"{len(write_errors)} of {len(batch)} article fixes in a batch failed")
+        return details.get("nModified", 0)
+
+
+async def backfill_legacy_articles(database: AsyncIOMotorDatabase, batch_size: int = 500) -> int:
+    """
+    Convert string published_date values to UTC datetimes and fill the fields
+    legacy documents lack (see ARTICLE_FIELD_DEFAULTS). Streams the collection and writes in
+    unordered batches, so it is safe to re-run and never holds the archive in memory.
+    """
+    query = {"$or": [
+        {"published_date": {"$not": {"$type": "date"}}},
+        *({field: None} for field in ARTICLE_FIELD_DEFAULTS),
+    ]}
+    projection = {"published_date": 1, **{f: 1 for f in ARTICLE_FIELD_DEFAULTS}}
+
+    updated = 0
+    batch: List[UpdateOne] = []
+    async for doc in database["articles"].find(query, projection, batch_size=batch_size):
+        fixes = _article_fixes(doc)
+        if fixes:
+            batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": fixes}))
+        if len(batch) >= batch_size:
+            updated += await _write_batch(database, batch)
+            batch = []
+    if batch:
+        updated += await _write_batch(database, batch)
+
+    logger.info(f"Backfilled {updated} legacy articles")
+    return updated
+
+
+MIGRATIONS = {
+    "backfill_legacy_articles": backfill_legacy_articles,
+}
+
+
+async def main(names: List[str]):
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    try:
+        for name in names:
+            await MIGRATIONS[name](client[settings.DATABASE_NAME])
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    requested = sys.argv[1:] or list(MIGRATIONS)
+    unknown = [name for name in requested if name not in MIGRATIONS]
+    if unknown:
+        sys.exit(f"Unknown migrations: {', '.join(unknown)}. Available: {', '.join(MIGRATIONS)}")
+    asyncio.run(main(requested))
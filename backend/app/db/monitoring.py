@@ -0,0 +1,69 @@
+import threading
+from typing import Any, Dict, Tuple
+
+from pymongo import monitoring
+from ..core.metrics import metrics_registry
+
+MONGO_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+mongodb_command_duration_seconds = metrics_registry.histogram(
+    "mongodb_command_duration_seconds", "MongoDB command latency by collection and command",
+    ("collection", "command"), MONGO_LATENCY_BUCKETS
+)
+mongodb_command_failures_total = metrics_registry.counter(
+    "mongodb_command_failures_total", "Failed MongoDB commands by collection and command",
+    ("collection", "command")
+)
+mongodb_documents_returned_total = metrics_registry.counter(
+    "mongodb_documents_returned_total", "Documents returned in cursor batches by collection and command",
+    ("collection", "command")
+)
+
+
+def _collection(event: monitoring.CommandStartedEvent) -> str:
+    # find/insert/update/aggregate/... name the collection as the command's value;
+    # getMore carries a cursor id there and the collection separately
+    command = event.command or {}
+    target = command.get("collection", command.get(event.command_name))
+    return target if isinstance(target, str) else ""
+
+
+def _documents_returned(reply: Dict[str, Any]) -> int:
+    cursor = reply.get("cursor") if isinstance(reply, dict) else None
+    if not isinstance(cursor, dict):
+        return 0
+    return len(cursor.get("firstBatch") or cursor.get("nextBatch") or [])
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """
+    pymongo command listener feeding the MongoDB metrics. pymongo calls it from
+    the thread running each operation, so it only does dictionary and counter updates.
+    """
+
+    def __init__(self):
+        self._collections: Dict[Tuple[Any, int], str] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        with self._lock:
+            self._collections[(event.connection_id, event.request_id)] = _collection(event)
+
+    def _finish(self, event) -> str:
+        with self._lock:
+            return self._collections.pop((event.connection_id, event.request_id), "")
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        collection = self._finish(event)
+        mongodb_command_duration_seconds.observe(event.duration_micros / 1e6, collection, event.command_name)
+        returned = _documents_returned(event.reply)
+        if returned:
+            mongodb_documents_returned_total.inc(collection, event.command_name, amount=returned)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        collection = self._finish(event)
+        mongodb_command_duration_seconds.observe(event.duration_micros / 1e6, collection, event.command_name)
+        mongodb_command_failures_total.inc(collection, event.command_name)
+
+
+command_metrics = CommandMetrics()
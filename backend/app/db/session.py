@@ -1,10 +1,14 @@
 from motor.motor_asyncio import AsyncIOMotorClient
 from ..core.config import settings
 from .base import db
+from .indexes import ensure_indexes
+from .monitoring import command_metrics
 
 async def connect_to_mongo():
-    db.client = AsyncIOMotorClient(settings.MONGODB_URL)
+    listeners = [command_metrics] if settings.METRICS_ENABLED else []
+    db.client = AsyncIOMotorClient(settings.MONGODB_URL, event_listeners=listeners)
     print(f"Connected to MongoDB: {settings.DATABASE_NAME}")
+    await ensure_indexes(db.client[settings.DATABASE_NAME])
 
 async def close_mongo_connection():
     db.client.close()
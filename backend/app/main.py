@@ -1,9 +1,25 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from typing import List
+from .core.cache import article_cache
 from .core.config import settings
+from .core.metrics import CONTENT_TYPE, Counter, Gauge, Metric, MetricsMiddleware, metrics_registry
+from .core.pagination import NEXT_CURSOR_HEADER
+from .core.profiling import ProfilingMiddleware
+from .core.security import password_hasher, require_admin, token_cache
+from .db.base import db
 from .db.session import connect_to_mongo, close_mongo_connection
+from .services.http_client import open_http_clients, close_http_clients
+from .services.ingestion_scheduler import start_ingestion_scheduler, stop_ingestion_scheduler
+from .services.provider_gateway import CircuitBreaker, provider_gateway
+from .services.summarization_service import summarization_service
+from .services.tagging_service import tagging_service
 from .api.api import api_router
+from .api.endpoints import profiling
+from .api.endpoints.auth import user_cache
+import asyncio
 import logging
+import time
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -18,8 +34,20 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Admin-only profiling; without a token neither the routes nor the middleware exist
+if settings.PROFILING_ADMIN_TOKEN:
+    app.add_middleware(ProfilingMiddleware)
+    app.include_router(
+        profiling.router, prefix="/debug/profile",
+        dependencies=[Depends(require_admin)], include_in_schema=False
+    )
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,22 +63,126 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 async def startup_db_client():
     await connect_to_mongo()
 
+@app.on_event("startup")
+async def startup_http_clients():
+    await open_http_clients()
+
+@app.on_event("startup")
+async def startup_ingestion_scheduler():
+    await start_ingestion_scheduler()
+
+@app.on_event("startup")
+async def startup_summarization():
+    await summarization_service.start()
+
+@app.on_event("shutdown")
+async def shutdown_ingestion_scheduler():
+    await stop_ingestion_scheduler()
+
+@app.on_event("shutdown")
+async def shutdown_tagging():
+    await tagging_service.shutdown()
+
+@app.on_event("shutdown")
+async def shutdown_summarization():
+    await summarization_service.stop()
+
+@app.on_event("shutdown")
+async def shutdown_password_hasher():
+    password_hasher.shutdown()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     await close_mongo_connection()
 
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+    await close_http_clients()
+
 @app.get("/")
 async def root():
     return {"message": f"Welcome to {settings.PROJECT_NAME}!"}
 
 @app.get("/health")
-async def health_check():
+async def health_check(response: Response):
+    """
+    Pings MongoDB and reports each provider's circuit. Unhealthy (503) when MongoDB
+    doesn't answer; degraded while any provider circuit is not closed.
+    """
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(db.client.admin.command("ping"), timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS)
+        database = {"status": "ok", "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+    except Exception as e:
+        logger.warning(f"Health check MongoDB ping failed: {str(e) or type(e).__name__}")
+        database = {"status": "error", "error": str(e) or type(e).__name__}
+
+    providers = {name: gate.breaker.state for name, gate in provider_gateway.gates.items()}
+    if database["status"] != "ok":
+        status = "unhealthy"
+        response.status_code = 503
+    elif any(state != CircuitBreaker.CLOSED for state in providers.values()):
+        status = "degraded"
+    else:
+        status = "healthy"
     return {
-        "status": "healthy",
+        "status": status,
         "version": "0.1.0",
-        "environment": "development"
+        "environment": "development",
+        "database": database,
+        "providers": providers
     }
 
+def application_metrics() -> List[Metric]:
+    """Cache, password hashing, provider circuit and tagging run state, read on every scrape"""
+    entries = Gauge("cache_entries", "Entries held by in-process caches", ("cache",))
+    hits = Counter("cache_hits_total", "In-process cache hits", ("cache",))
+    misses = Counter("cache_misses_total", "In-process cache misses", ("cache",))
+    evictions = Counter("cache_evictions_total", "In-process cache evictions", ("cache",))
+    for name, cache in (("responses", article_cache), ("auth_tokens", token_cache), ("auth_users", user_cache)):
+        stats = cache.stats()
+        entries.set(stats["size"], name)
+        hits.inc(name, amount=stats["hits"])
+        misses.inc(name, amount=stats["misses"])
+        evictions.inc(name, amount=stats["evictions"])
+
+    hasher = password_hasher.stats()
+    hash_calls = Counter("password_hash_calls_total", "Password hash and verify calls")
+    hash_calls.inc(amount=hasher["calls"])
+    hash_in_flight = Gauge("password_hash_in_flight", "Password hash and verify calls running or queued")
+    hash_in_flight.set(hasher["in_flight"])
+    hash_wait = Counter("password_hash_queue_wait_seconds_total", "Time password hashing waited for a worker")
+    hash_wait.inc(amount=hasher["queue_wait_seconds_total"])
+
+    circuit = Gauge("provider_circuit_state", "1 for each provider's current circuit state", ("provider", "state"))
+    for name, gate in provider_gateway.gates.items():
+        for state in (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN):
+            circuit.set(1 if gate.breaker.state == state else 0, name, state)
+
+    # The last finished tagging run; absent until one has run in this process
+    tagging = tagging_service.last_run
+    tagging_metrics: List[Metric] = []
+    if tagging:
+        for name, documentation, key in (
+            ("tagging_last_run_articles", "Articles tagged by the last tagging run", "articles"),
+            ("tagging_last_run_batches", "Batches in the last tagging run", "batches"),
+            ("tagging_last_run_seconds", "Duration of the last tagging run", "seconds"),
+            ("tagging_last_run_articles_per_second", "Throughput of the last tagging run", "articles_per_second"),
+            ("tagging_last_run_inference_articles_per_second",
+             "Throughput of the last tagging run counting inference time only", "inference_articles_per_second"),
+            ("tagging_last_run_timestamp_seconds", "Unix time the last tagging run finished", "finished_at"),
+        ):
+            gauge = Gauge(name, documentation, ("backend",))
+            gauge.set(tagging[key], tagging["backend"])
+            tagging_metrics.append(gauge)
+    return [entries, hits, misses, evictions, hash_calls, hash_in_flight, hash_wait, circuit] + tagging_metrics
+
+metrics_registry.register_collector(application_metrics)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(content=metrics_registry.render(), media_type=CONTENT_TYPE)
+
 # Later we'll include API routers here
 # from .api.api import api_router
 # app.include_router(api_router, prefix=settings.API_V1_STR)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, HttpUrl
-from typing import List, Optional, Union
+from typing import List, Optional
 from datetime import datetime
 
 class ArticleBase(BaseModel):
@@ -7,12 +7,13 @@ class ArticleBase(BaseModel):
     source: str
     source_url: str  # Changed from HttpUrl to str to be more flexible
     author: Optional[str] = None
-    published_date: Union[datetime, str]  # Accept either datetime or string
+    published_date: datetime  # Stored as a UTC datetime so sorts and range queries work
     synopsis: Optional[str] = ""
     content: Optional[str] = ""
     image_url: Optional[str] = None  # Changed from HttpUrl to Optional[str]
     categories: List[str] = []
     ai_tags: List[str] = []
+    summary: Optional[str] = None  # Generated from content by the summarization service
 
 class ArticleCreate(ArticleBase):
     pass
@@ -33,6 +34,8 @@ class Article(ArticleBase):
     id: str
     created_at: datetime
     updated_at: datetime
+    score: Optional[float] = None  # Search relevance, only set on search results
+    cluster_id: Optional[str] = None  # Shared by near-duplicate stories from different providers
     
     class Config:
         from_attributes = True
@@ -42,4 +45,57 @@ class ArticleInDB(Article):
 
 class ArticlePublic(Article):
     # This class can be used if we want to hide certain fields from public view
-    pass
\ No newline at end of file
+    pass
+
+class ArticleSummary(BaseModel):
+    # What list views render; full content is only loaded by GET /articles/{id}
+    id: str
+    title: str
+    source: str
+    source_url: str
+    author: Optional[str] = None
+    published_date: datetime
+    synopsis: Optional[str] = ""
+    image_url: Optional[str] = None
+    categories: List[str] = []
+    ai_tags: List[str] = []
+    summary: Optional[str] = None
+    cluster_id: Optional[str] = None
+    score: Optional[float] = None  # Search relevance, only set on search results
+    
+    class Config:
+        from_attributes = True
+        extra = "allow"  # Extra fields requested with fields= pass through
+
+class ArticlePage(BaseModel):
+    # One page of a listing; pass next_cursor back as cursor= for the next page (None on the last)
+    items: List[ArticleSummary] = []
+    next_cursor: Optional[str] = None
+
+class ArticleBatchRequest(BaseModel):
+    ids: List[str]
+
+class ArticleBatch(BaseModel):
+    # Found articles in request order; ids with no stored article are listed in missing
+    articles: List[ArticleSummary] = []
+    missing: List[str] = []
+
+# Mongo projection matching ArticleSummary
+ARTICLE_SUMMARY_PROJECTION = {
+    "_id": 0,
+    **{field: 1 for field in ArticleSummary.model_fields if field != "score"}
+}
+
+def article_list_projection(fields: Optional[str] = None) -> dict:
+    """
+    ARTICLE_SUMMARY_PROJECTION plus any comma-separated Article fields requested.
+    Raises ValueError on unknown field names.
+    """
+    projection = dict(ARTICLE_SUMMARY_PROJECTION)
+    if fields:
+        requested = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in requested if f not in Article.model_fields or f == "score"]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        projection.update({field: 1 for field in requested})
+    return projection
\ No newline at end of file
@@ -31,6 +31,12 @@ class User(UserInDBBase):
 class UserInDB(UserInDBBase):
     hashed_password: str
 
+class AuthUser(UserBase):
+    """The identity a bearer token resolves to, without the profile lists"""
+    id: str
+    created_at: datetime = None
+    updated_at: datetime = None
+
 class Token(BaseModel):
     access_token: str
     token_type: str
@@ -0,0 +1,215 @@
+import logging
+import random
+import re
+import uuid
+import zlib
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def shingles(text: str, size: int = 2) -> Set[str]:
+    """Word n-grams of the normalized text (single words for very short texts)"""
+    tokens = TOKEN_PATTERN.findall((text or "").lower())
+    if len(tokens) < size:
+        return set(tokens)
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+class MinHasher:
+    """MinHash signatures from universal hashes (a*x + b) mod p over crc32 shingle hashes"""
+
+    def __init__(self, num_perm: int, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.params = [
+            (rng.randint(1, MERSENNE_PRIME - 1), rng.randint(0, MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, features: Set[str]) -> List[int]:
+        if not features:
+            return [MAX_HASH] * self.num_perm
+        hashes = [zlib.crc32(f.encode("utf-8")) for f in features]
+        return [
+            min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+            for a, b in self.params
+        ]
+
+
+def similarity(left: List[int], right: List[int]) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures"""
+    if not left or len(left) != len(right):
+        return 0.0
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+class NearDuplicateIndex:
+    """
+    In-memory LSH band index over MinHash signatures of recent articles, keyed by source_url.
+    Candidate lookup touches only the articles sharing at least one band, so
+    clustering a new article is sub-linear in the size of the window. Every replica
+    keeps its own copy, kept current by sync() from the stored signatures.
+    """
+
+    def __init__(self, num_perm: int, bands: int, threshold: float, window: timedelta):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.window = window
+        # created_at of the newest stored article read by sync()
+        self.synced_until: Optional[datetime] = None
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[str]] = defaultdict(set)
+        self._entries: Dict[str, Tuple[List[int], str]] = {}
+        self._order: Deque[Tuple[datetime, str]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _band_keys(self, signature: List[int]):
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows:(band + 1) * self.rows])
+
+    def signature_for(self, article: Dict[str, Any]) -> List[int]:
+        text = f"{article.get('title') or ''} {article.get('synopsis') or ''}"
+        return self.hasher.signature(shingles(text))
+
+    def add(self, key: str, signature: List[int], cluster_id: str, seen_at: datetime):
+        if key in self._entries:
+            return
+        self._entries[key] = (signature, cluster_id)
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].add(key)
+        self._order.append((seen_at, key))
+
+    def _evict(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band_key in self._band_keys(entry[0]):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def prune(self, now: Optional[datetime] = None):
+        cutoff = (now or datetime.utcnow()) - self.window
+        while self._order and self._order[0][0] < cutoff:
+            self._evict(self._order.popleft()[1])
+
+    def best_match(self, signature: List[int]) -> Optional[Tuple[str, float]]:
+        """Cluster id and similarity of the closest indexed article above the threshold"""
+        candidates: Set[str] = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+        best = None
+        for key in candidates:
+            stored_signature, cluster_id = self._entries[key]
+            score = similarity(signature, stored_signature)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (cluster_id, score)
+        return best
+
+    def staging(self) -> "NearDuplicateIndex":
+        """An empty index with the same hashing, for a batch that isn't stored yet"""
+        return NearDuplicateIndex(self.hasher.num_perm, self.bands, self.threshold, self.window)
+
+    def cluster(self, article: Dict[str, Any], staged: "NearDuplicateIndex", now: Optional[datetime] = None) -> str:
+        """
+        Sign the article, join the cluster of its nearest recent duplicate here or in
+        staged (or start one), index it in staged, and record "minhash" and "cluster_id"
+        on the article dict. merge() the staged entries once the batch is stored.
+        """
+        key = article["source_url"]
+        entry = self._entries.get(key) or staged._entries.get(key)
+        if entry is not None:
+            signature, cluster_id = entry
+        else:
+            signature = self.signature_for(article)
+            matches = [m for m in (self.best_match(signature), staged.best_match(signature)) if m]
+            if matches:
+                cluster_id = max(matches, key=lambda m: m[1])[0]
+            else:
+                cluster_id = article.setdefault("id", str(uuid.uuid4()))
+            staged.add(key, signature, cluster_id, now or datetime.utcnow())
+        article["minhash"] = signature
+        article["cluster_id"] = cluster_id
+        return cluster_id
+
+    def merge(self, staged: "NearDuplicateIndex"):
+        for seen_at, key in staged._order:
+            signature, cluster_id = staged._entries[key]
+            self.add(key, signature, cluster_id, seen_at)
+
+    async def sync(self, db: AsyncIOMotorDatabase):
+        """
+        Index the stored signatures this replica hasn't seen: everything inside the
+        window on the first call, then articles created since the previous sync (by
+        any replica). The overlap covers writes that commit out of created_at order.
+        """
+        since = datetime.utcnow() - self.window
+        if self.synced_until is not None:
+            since = max(since, self.synced_until - timedelta(seconds=settings.DEDUP_SYNC_OVERLAP_SECONDS))
+        cursor = db["articles"].find(
+            {"created_at": {"$gte": since}, "minhash": {"$exists": True}},
+            {"_id": 0, "source_url": 1, "minhash": 1, "cluster_id": 1, "id": 1, "created_at": 1}
+        ).sort("created_at", 1)
+        before = len(self)
+        async for doc in cursor:
+            if len(doc["minhash"]) == self.hasher.num_perm:
+                self.add(doc["source_url"], doc["minhash"], doc.get("cluster_id") or doc["id"], doc["created_at"])
+            if self.synced_until is None or doc["created_at"] > self.synced_until:
+                self.synced_until = doc["created_at"]
+        if self.synced_until is None:
+            # Nothing stored yet; later syncs start from here rather than rescanning the window
+            self.synced_until = datetime.utcnow()
+        if len(self) > before:
+            logger.info(f"Synced {len(self) - before} article signatures into the near-duplicate index")
+
+
+near_duplicate_index = NearDuplicateIndex(
+    num_perm=settings.DEDUP_NUM_PERM,
+    bands=settings.DEDUP_BANDS,
+    threshold=settings.DEDUP_SIMILARITY_THRESHOLD,
+    window=timedelta(hours=settings.DEDUP_WINDOW_HOURS)
+)
+
+
+async def assign_clusters(
+    db: AsyncIOMotorDatabase, articles: List[Dict[str, Any]]
+) -> Tuple[int, NearDuplicateIndex]:
+    """
+    Cluster fetched articles against each other and recently stored ones. Returns how
+    many joined an existing cluster, and the batch's staged index entries to merge
+    into near_duplicate_index once the articles are stored.
+    """
+    await near_duplicate_index.sync(db)
+    near_duplicate_index.prune()
+
+    staged = near_duplicate_index.staging()
+    duplicates = 0
+    for article in articles:
+        if not article.get("source_url"):
+            continue
+        key = article["source_url"]
+        already_indexed = key in near_duplicate_index or key in staged
+        cluster_id = near_duplicate_index.cluster(article, staged)
+        if not already_indexed and cluster_id != article.get("id"):
+            duplicates += 1
+    return duplicates, staged
@@ -0,0 +1,115 @@
+import logging
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateMany
+from ..core.config import settings
+from ..core.pagination import ARTICLE_SORT
+from ..schemas.article import ARTICLE_SUMMARY_PROJECTION
+
+logger = logging.getLogger(__name__)
+
+FEED_COLLECTION = "user_feeds"
+ENTRY_FIELDS = [field for field in ARTICLE_SUMMARY_PROJECTION if field != "_id"]
+# Keeps each feed's items newest first, in the same order as the article listings
+ITEMS_SORT = {field: direction for field, direction in ARTICLE_SORT}
+
+
+def feed_entry(article: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The ArticleSummary fields of an article, as copied into feeds. ai_tags and summary
+    are whatever the article had at fan-out time; they are not backfilled into feeds.
+    """
+    return {field: article[field] for field in ENTRY_FIELDS if field in article}
+
+
+async def user_interests(db: AsyncIOMotorDatabase, user_id: str) -> List[str]:
+    """
+    Category slugs a user's feed follows: their categories, plus the categories
+    that come up most among their recently saved articles.
+    """
+    interests = await db["categories"].distinct("slug", {"user_id": user_id})
+    user = await db["users"].find_one({"id": user_id}, {"_id": 0, "saved_articles": 1})
+    saved = (user or {}).get("saved_articles") or []
+    if saved:
+        counts: Counter = Counter()
+        cursor = db["articles"].find(
+            {"id": {"$in": saved[-settings.FEED_SAVED_ARTICLES_SCANNED:]}}, {"_id": 0, "categories": 1}
+        )
+        async for article in cursor:
+            counts.update(article.get("categories") or [])
+        interests.extend(
+            c for c, _ in counts.most_common(settings.FEED_SAVED_CATEGORY_LIMIT) if c not in interests
+        )
+    return interests
+
+
+async def rebuild_feed(db: AsyncIOMotorDatabase, user_id: str) -> Dict[str, Any]:
+    """Recompute a user's interests and refill their feed from the stored articles"""
+    interests = await user_interests(db, user_id)
+    items = []
+    if interests:
+        items = await db["articles"].find(
+            {"categories": {"$in": interests}}, ARTICLE_SUMMARY_PROJECTION
+        ).sort(ARTICLE_SORT).limit(settings.FEED_MAX_ITEMS).to_list(length=settings.FEED_MAX_ITEMS)
+    now = datetime.utcnow()
+    feed = {"_id": user_id, "interests": interests, "items": items, "built_at": now, "updated_at": now}
+    await db[FEED_COLLECTION].replace_one({"_id": user_id}, feed, upsert=True)
+    return feed
+
+
+async def read_feed(db: AsyncIOMotorDatabase, user_id: str, skip: int, limit: int) -> List[Dict[str, Any]]:
+    """One page of a user's feed, building the feed on first read"""
+    feed = await db[FEED_COLLECTION].find_one({"_id": user_id}, {"items": {"$slice": [skip, limit]}})
+    if feed is None:
+        feed = await rebuild_feed(db, user_id)
+        return feed["items"][skip:skip + limit]
+    return feed["items"]
+
+
+async def fan_out(db: AsyncIOMotorDatabase, articles: List[Dict[str, Any]]) -> int:
+    """
+    Push newly stored articles onto the feeds following their categories. Feeds that match
+    the same set of categories get identical entries, so each such group is one UpdateMany
+    and the $push keeps the items sorted and capped at FEED_MAX_ITEMS.
+    Returns the number of feeds updated.
+    """
+    by_category: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for article in articles:
+        for category in article.get("categories") or []:
+            by_category[category].append(article)
+    if not by_category:
+        return 0
+
+    groups: Dict[FrozenSet[str], List[str]] = defaultdict(list)
+    cursor = db[FEED_COLLECTION].find({"interests": {"$in": list(by_category)}}, {"interests": 1})
+    async for feed in cursor:
+        groups[frozenset(by_category.keys() & set(feed["interests"]))].append(feed["_id"])
+    if not groups:
+        return 0
+
+    now = datetime.utcnow()
+    operations = []
+    for matched, user_ids in groups.items():
+        entries = {}
+        for category in matched:
+            for article in by_category[category]:
+                entries.setdefault(article["id"], feed_entry(article))
+        update = {
+            "$push": {"items": {
+                "$each": list(entries.values()),
+                "$sort": ITEMS_SORT,
+                "$slice": settings.FEED_MAX_ITEMS,
+            }},
+            "$set": {"updated_at": now},
+        }
+        for start in range(0, len(user_ids), settings.FEED_FANOUT_BATCH_SIZE):
+            batch = user_ids[start:start + settings.FEED_FANOUT_BATCH_SIZE]
+            operations.append(UpdateMany({"_id": {"$in": batch}}, update))
+
+    await db[FEED_COLLECTION].bulk_write(operations, ordered=False)
+    updated = sum(len(user_ids) for user_ids in groups.values())
+    logger.info(f"Fanned {len(articles)} new articles out to {updated} feeds")
+    return updated
@@ -0,0 +1,128 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+from pymongo import UpdateOne
+from ..db.base import get_database
+
+logger = logging.getLogger(__name__)
+
+COLLECTION = "provider_fetch_state"
+
+
+def format_since(value: datetime) -> str:
+    """ISO 8601 UTC timestamp in the form all three providers accept for from/from-date"""
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+@dataclass
+class FetchState:
+    """
+    What we already have from one provider query (provider + category/section/topic):
+    the newest published date seen and the validators of the last response.
+    """
+    provider: str
+    query: str
+    newest_published: Optional[datetime] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # The "since" value the validators belong to; they only apply to the same request
+    validated_since: Optional[datetime] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.provider}:{self.query}"
+
+    def conditional_headers(self, since: Optional[datetime]) -> Dict[str, str]:
+        if since != self.validated_since:
+            return {}
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def record(self, response: httpx.Response, articles: List[Dict[str, Any]], since: Optional[datetime]):
+        published = [a["published_date"] for a in articles if isinstance(a.get("published_date"), datetime)]
+        if published:
+            # Providers occasionally post-date items; never move the cursor past now
+            newest = min(max(published), datetime.utcnow())
+            if self.newest_published is None or newest > self.newest_published:
+                self.newest_published = newest
+        self.etag = response.headers.get("etag")
+        self.last_modified = response.headers.get("last-modified")
+        self.validated_since = since
+
+
+@dataclass
+class FetchBatch:
+    """
+    Fetched articles plus the fetch states that cover them. The states are only saved
+    once the articles are stored, so a failed or cancelled write refetches them next run.
+    """
+    articles: List[Dict[str, Any]] = field(default_factory=list)
+    states: List[FetchState] = field(default_factory=list)
+
+    def extend(self, other: "FetchBatch"):
+        self.articles.extend(other.articles)
+        self.states.extend(other.states)
+
+
+class FetchStateStore:
+    """Fetch state persisted in Mongo, one document per provider query"""
+
+    async def load(self, provider: str, query: str) -> FetchState:
+        state = FetchState(provider, query)
+        try:
+            db = await get_database()
+            doc = await db[COLLECTION].find_one({"_id": state.key})
+        except Exception as e:
+            logger.warning(f"Could not load fetch state for {state.key}, fetching from scratch: {str(e)}")
+            return state
+        if doc:
+            state.newest_published = doc.get("newest_published")
+            state.etag = doc.get("etag")
+            state.last_modified = doc.get("last_modified")
+            state.validated_since = doc.get("validated_since")
+        return state
+
+    @staticmethod
+    def _save_operation(state: FetchState, now: datetime) -> UpdateOne:
+        return UpdateOne(
+            {"_id": state.key},
+            {"$set": {
+                "provider": state.provider,
+                "query": state.query,
+                "newest_published": state.newest_published,
+                "etag": state.etag,
+                "last_modified": state.last_modified,
+                "validated_since": state.validated_since,
+                "updated_at": now,
+            }},
+            upsert=True
+        )
+
+    async def save(self, state: FetchState):
+        await self.save_all([state])
+
+    async def save_all(self, states: List[FetchState]):
+        """Persist fetch states in one bulk write; failures only cost a refetch next run"""
+        if not states:
+            return
+        try:
+            db = await get_database()
+            now = datetime.utcnow()
+            await db[COLLECTION].bulk_write([self._save_operation(state, now) for state in states], ordered=False)
+        except Exception as e:
+            logger.warning(f"Could not save fetch state for {', '.join(s.key for s in states)}: {str(e)}")
+
+    async def reset(self, provider: Optional[str] = None):
+        """Forget fetch state (for one provider, or all), forcing full fetches"""
+        db = await get_database()
+        await db[COLLECTION].delete_many({"provider": provider} if provider else {})
+
+
+fetch_state_store = FetchStateStore()
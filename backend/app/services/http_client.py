@@ -0,0 +1,78 @@
+import httpx
+import logging
+from typing import Dict, Optional
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def _provider_limits(provider: str) -> httpx.Limits:
+    """Keep-alive pool sizing for a provider, falling back to the defaults"""
+    max_connections = settings.HTTP_PROVIDER_MAX_CONNECTIONS.get(
+        provider, settings.HTTP_MAX_CONNECTIONS
+    )
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
+def _provider_timeout(provider: str) -> httpx.Timeout:
+    """Request timeout for a provider, falling back to the default"""
+    timeout = settings.HTTP_PROVIDER_TIMEOUTS.get(provider, settings.HTTP_TIMEOUT)
+    return httpx.Timeout(timeout, connect=min(timeout, settings.HTTP_CONNECT_TIMEOUT))
+
+
+class HTTPClients:
+    """Process-wide registry of pooled HTTP clients, one per news provider"""
+    def __init__(self):
+        self.clients: Dict[str, httpx.AsyncClient] = {}
+        self.transport: Optional[httpx.AsyncBaseTransport] = None
+
+    def get(self, provider: str) -> httpx.AsyncClient:
+        client = self.clients.get(provider)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE and self.transport is None,
+                limits=_provider_limits(provider),
+                timeout=_provider_timeout(provider),
+                transport=self.transport,
+                headers={"User-Agent": f"{settings.PROJECT_NAME}/0.1.0"},
+            )
+            self.clients[provider] = client
+        return client
+
+    async def close(self):
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients = {}
+
+
+http_clients = HTTPClients()
+
+
+def get_http_client(provider: str) -> httpx.AsyncClient:
+    """Return the shared client for a provider, creating it on first use"""
+    return http_clients.get(provider)
+
+
+async def open_http_clients(transport: Optional[httpx.AsyncBaseTransport] = None):
+    """
+    Reset the registry. Pass a transport (e.g. httpx.MockTransport) to route
+    every provider client through it.
+    """
+    await http_clients.close()
+    http_clients.transport = transport
+    logger.info(f"HTTP client registry ready (http2={'on' if HTTP2_AVAILABLE else 'off'})")
+
+
+async def close_http_clients():
+    await http_clients.close()
+    logger.info("Closed HTTP client registry")
@@ -0,0 +1,315 @@
+import asyncio
+import logging
+import random
+import socket
+import uuid
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from ..core.config import settings
+from ..db.base import get_database
+from .ingestion_service import ingest_articles
+from .news_api_service import get_enabled_providers
+
+logger = logging.getLogger(__name__)
+
+LEASE_NAME = "article-ingestion"
+
+
+def replica_id() -> str:
+    return f"{socket.gethostname()}:{uuid.uuid4().hex[:8]}"
+
+
+class IngestionLease:
+    """
+    Mongo-backed lease so runs never overlap across replicas. The holder re-acquires
+    (and extends) it for every run; it expires on its own if the holder dies.
+    Which replica runs a scheduled target is decided by IngestionTargets.
+    """
+
+    def __init__(self, owner: str, name: str = LEASE_NAME):
+        self.name = name
+        self.owner = owner
+
+    async def acquire(self, db) -> bool:
+        now = datetime.utcnow()
+        try:
+            await db["ingestion_leases"].find_one_and_update(
+                {"_id": self.name, "$or": [{"expires_at": {"$lt": now}}, {"owner": self.owner}]},
+                {"$set": {
+                    "owner": self.owner,
+                    "expires_at": now + timedelta(seconds=settings.INGESTION_LEASE_SECONDS)
+                }},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+            return True
+        except DuplicateKeyError:
+            # Another replica holds an unexpired lease
+            return False
+
+    async def release(self, db):
+        await db["ingestion_leases"].delete_one({"_id": self.name, "owner": self.owner})
+
+
+class IngestionTargets:
+    """
+    Last scheduled run of every (provider, category) target, shared by the replicas in
+    the ingestion_targets collection. A replica claims a due target before fetching it,
+    so each target is fetched once per interval however many replicas run the scheduler.
+    """
+
+    def __init__(self, owner: str):
+        self.owner = owner
+
+    @staticmethod
+    def _key(provider: str, category: str) -> str:
+        return f"{provider}:{category}"
+
+    async def claim(self, db, provider: str, category: str) -> bool:
+        """Record a run of the target now; False if another replica ran it within the interval"""
+        now = datetime.utcnow()
+        # Local schedules are jittered, so a run anywhere in the jitter window counts
+        min_gap = max(1, settings.INGESTION_INTERVAL_SECONDS - settings.INGESTION_JITTER_SECONDS)
+        try:
+            await db["ingestion_targets"].find_one_and_update(
+                {"_id": self._key(provider, category), "$or": [
+                    {"last_run_at": {"$lte": now - timedelta(seconds=min_gap)}},
+                    # Our own failed run may be retried before the interval is up
+                    {"owner": self.owner, "failed": True},
+                ]},
+                {"$set": {
+                    "provider": provider,
+                    "category": category,
+                    "owner": self.owner,
+                    "last_run_at": now,
+                    "failed": False,
+                }},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    async def mark_failed(self, db, providers: List[str], category: str):
+        await db["ingestion_targets"].update_many(
+            {"_id": {"$in": [self._key(p, category) for p in providers]}, "owner": self.owner},
+            {"$set": {"failed": True}}
+        )
+
+
+class IngestionScheduler:
+    """
+    Polls every (provider, category) pair on a jittered interval in the background,
+    and coalesces on-demand refresh requests so the API never waits on the providers.
+    """
+
+    def __init__(self):
+        owner = replica_id()
+        self.lease = IngestionLease(owner)
+        self.targets = IngestionTargets(owner)
+        self._poll_task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._run_lock: Optional[asyncio.Lock] = None
+        self._next_run: Dict[Tuple[str, str], float] = {}
+        self._failures: Dict[Tuple[str, str], int] = {}
+        self._pending: Optional[asyncio.Future] = None
+        self._pending_categories: Set[str] = set()
+        self._pending_all = False
+        self._pending_providers: Set[str] = set()
+        self._pending_all_providers = False
+
+    @property
+    def running(self) -> bool:
+        return self._poll_task is not None and not self._poll_task.done()
+
+    async def start(self):
+        if not settings.INGESTION_ENABLED:
+            logger.info("Background ingestion disabled")
+            return
+        self._poll_task = asyncio.create_task(self._poll_loop())
+        logger.info(f"Ingestion scheduler started ({settings.INGESTION_INTERVAL_SECONDS}s interval)")
+
+    async def stop(self):
+        for task in (self._poll_task, self._refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._poll_task = None
+        self._refresh_task = None
+        if self._pending is not None and not self._pending.done():
+            self._pending.cancel()
+        self._pending = None
+        logger.info("Ingestion scheduler stopped")
+
+    def request_refresh(
+        self,
+        categories: Optional[List[str]] = None,
+        providers: Optional[List[str]] = None
+    ) -> asyncio.Future:
+        """
+        Queue a refresh of categories from providers (all of either when not given) and
+        return a future resolving to the number of inserted articles. Requests arriving
+        while a refresh is queued are merged into it, so it fetches the union of both.
+        """
+        if self._pending is None:
+            self._pending = asyncio.get_running_loop().create_future()
+            self._pending_categories = set()
+            self._pending_all = False
+            self._pending_providers = set()
+            self._pending_all_providers = False
+        if categories:
+            self._pending_categories.update(c.lower() for c in categories)
+        else:
+            self._pending_all = True
+        if providers:
+            self._pending_providers.update(p.lower() for p in providers)
+        else:
+            self._pending_all_providers = True
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._drain_refreshes())
+        return self._pending
+
+    async def _drain_refreshes(self):
+        while self._pending is not None:
+            future = self._pending
+            categories = None if self._pending_all else sorted(self._pending_categories)
+            providers = None if self._pending_all_providers else sorted(self._pending_providers)
+            self._pending = None
+            try:
+                inserted = await self._run(categories, providers)
+                if not future.done():
+                    future.set_result(inserted)
+            except Exception as e:
+                logger.exception(f"On-demand refresh failed: {str(e)}")
+                if not future.done():
+                    future.set_result(0)
+
+    async def _poll_loop(self):
+        while True:
+            try:
+                await self._poll_due_targets()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Scheduled ingestion failed: {str(e)}")
+            await asyncio.sleep(self._seconds_until_next_run())
+
+    def _jittered_interval(self) -> float:
+        jitter = settings.INGESTION_JITTER_SECONDS
+        return max(1.0, settings.INGESTION_INTERVAL_SECONDS + random.uniform(-jitter, jitter))
+
+    def _retry_delay(self, failures: int) -> float:
+        """Exponential backoff for a failing target, never longer than the regular interval"""
+        delay = settings.INGESTION_RETRY_BACKOFF_SECONDS * (2 ** (failures - 1))
+        return min(float(settings.INGESTION_INTERVAL_SECONDS), delay)
+
+    def _seconds_until_next_run(self) -> float:
+        if not self._next_run:
+            return float(settings.INGESTION_INTERVAL_SECONDS)
+        loop_time = asyncio.get_running_loop().time()
+        return max(1.0, min(self._next_run.values()) - loop_time)
+
+    async def _poll_due_targets(self):
+        loop_time = asyncio.get_running_loop().time()
+        due: Dict[str, List[str]] = defaultdict(list)
+        for provider in get_enabled_providers():
+            for category in settings.INGESTION_CATEGORIES:
+                target = (provider, category)
+                # Spread the first run of each target over the jitter window
+                next_run = self._next_run.setdefault(
+                    target, loop_time + random.uniform(0, settings.INGESTION_JITTER_SECONDS)
+                )
+                if next_run <= loop_time:
+                    due[category].append(provider)
+
+        # One fetch per category so cross-provider dedup still applies within it.
+        # Every due target is rescheduled, so one failing category can't stall the others
+        # or have the poll loop retry it every second.
+        for category, providers in due.items():
+            try:
+                ran = await self._run_scheduled(category, providers)
+                failed = False
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Scheduled ingestion of {category} failed: {str(e)}")
+                ran, failed = True, True
+
+            now = asyncio.get_running_loop().time()
+            for provider in providers:
+                target = (provider, category)
+                if failed:
+                    self._failures[target] = self._failures.get(target, 0) + 1
+                    self._next_run[target] = now + self._retry_delay(self._failures[target])
+                elif not ran:
+                    # Another replica's run held the lease; try again shortly
+                    self._next_run[target] = now + self._retry_delay(1)
+                else:
+                    self._failures.pop(target, None)
+                    self._next_run[target] = now + self._jittered_interval()
+
+    @asynccontextmanager
+    async def _leased(self) -> AsyncIterator[Optional[AsyncIOMotorDatabase]]:
+        """Yields the database while holding the run lock and the lease, or None if another replica holds it"""
+        if self._run_lock is None:
+            self._run_lock = asyncio.Lock()
+        async with self._run_lock:
+            db = await get_database()
+            if not await self.lease.acquire(db):
+                logger.info("Ingestion lease held by another replica; skipping run")
+                yield None
+                return
+            try:
+                yield db
+            finally:
+                await self.lease.release(db)
+
+    async def _run(self, categories: Optional[List[str]], providers: Optional[List[str]] = None) -> int:
+        async with self._leased() as db:
+            if db is None:
+                return 0
+            result = await ingest_articles(db, categories, providers)
+            return result.inserted
+
+    async def _run_scheduled(self, category: str, providers: List[str]) -> bool:
+        """
+        Fetch the providers' due targets for category that no other replica ran within
+        the interval. False when the lease was busy and nothing ran.
+        """
+        async with self._leased() as db:
+            if db is None:
+                return False
+            claimed = [p for p in providers if await self.targets.claim(db, p, category)]
+            if not claimed:
+                logger.debug(f"{category} was already fetched by another replica")
+                return True
+            try:
+                await ingest_articles(db, [category], claimed)
+            except Exception:
+                try:
+                    await self.targets.mark_failed(db, claimed, category)
+                except Exception as e:
+                    logger.warning(f"Could not mark {category} targets failed: {str(e)}")
+                raise
+            return True
+
+
+ingestion_scheduler = IngestionScheduler()
+
+
+async def start_ingestion_scheduler():
+    await ingestion_scheduler.start()
+
+
+async def stop_ingestion_scheduler():
+    await ingestion_scheduler.stop()
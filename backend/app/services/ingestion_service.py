@@ -0,0 +1,153 @@
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+import logging
+import uuid
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from ..core.cache import article_cache
+from .dedup_service import assign_clusters, near_duplicate_index
+from .feed_service import fan_out
+from .fetch_state import fetch_state_store
+from ..core.config import settings
+from ..core.tracing import count, span, start_trace
+from .news_api_service import get_articles
+from .summarization_service import assign_content_hashes, summarization_service
+from .tagging_service import tagging_service
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ArticleWriteResult:
+    """Outcome of one bulk article write"""
+    inserted: int = 0
+    matched: int = 0
+    modified: int = 0
+    failed: int = 0
+    inserted_articles: List[Dict[str, Any]] = field(default_factory=list)
+
+def _merge_batch(articles: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Collapse articles sharing a source_url, merging their categories"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for article in articles:
+        source_url = article.get("source_url")
+        if not source_url:
+            continue
+        categories = [c for c in article.get("categories") or [] if c]
+        if source_url in merged:
+            existing = merged[source_url]["categories"]
+            existing.extend(c for c in categories if c not in existing)
+        else:
+            merged[source_url] = {**article, "categories": list(dict.fromkeys(categories))}
+    return merged
+
+def _insert_fields(article: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    insert_fields = {
+        k: v for k, v in article.items()
+        if k not in ("_id", "categories")
+    }
+    insert_fields.setdefault("id", str(uuid.uuid4()))
+    insert_fields.setdefault("created_at", now)
+    insert_fields.setdefault("updated_at", now)
+    return insert_fields
+
+def _upsert_operation(article: Dict[str, Any], insert_fields: Dict[str, Any]) -> UpdateOne:
+    return UpdateOne(
+        {"source_url": article["source_url"]},
+        {
+            "$setOnInsert": insert_fields,
+            # Stored articles keep their fields but pick up any new categories
+            "$addToSet": {"categories": {"$each": article["categories"]}},
+        },
+        upsert=True
+    )
+
+async def store_articles(db: AsyncIOMotorDatabase, articles: List[Dict[str, Any]]) -> ArticleWriteResult:
+    """
+    Upsert fetched articles keyed on source_url in one unordered bulk write.
+    Relies on the unique source_url index so concurrent refreshes can't insert duplicates.
+    """
+    merged = _merge_batch(articles)
+    if not merged:
+        return ArticleWriteResult()
+
+    now = datetime.utcnow()
+    articles = list(merged.values())
+    documents = [_insert_fields(article, now) for article in articles]
+    operations = [_upsert_operation(article, doc) for article, doc in zip(articles, documents)]
+
+    def inserted(indexes) -> List[Dict[str, Any]]:
+        # Operation index -> the article as stored, for fanning new articles out to feeds
+        return [{**documents[i], "categories": articles[i]["categories"]} for i in indexes]
+
+    try:
+        result = await db["articles"].bulk_write(operations, ordered=False)
+        return ArticleWriteResult(
+            inserted=result.upserted_count,
+            matched=result.matched_count,
+            modified=result.modified_count,
+            inserted_articles=inserted(result.upserted_ids)
+        )
+    except BulkWriteError as e:
+        details = e.details
+        for error in details.get("writeErrors", [])[:5]:
+            logger.error(f"Error saving article: {error.get('errmsg')}")
+        return ArticleWriteResult(
+            inserted=details.get("nUpserted", 0),
+            matched=details.get("nMatched", 0),
+            modified=details.get("nModified", 0),
+            failed=len(details.get("writeErrors", [])),
+            inserted_articles=inserted(u["index"] for u in details.get("upserted", []))
+        )
+
+async def ingest_articles(
+    db: AsyncIOMotorDatabase,
+    categories: Optional[List[str]] = None,
+    providers: Optional[List[str]] = None
+) -> ArticleWriteResult:
+    """
+    Fetch articles from the news providers and store the new ones. Fetch states
+    (newest published date, validators) only advance once the store succeeded.
+    """
+    with start_trace("ingestion", categories=categories, providers=providers):
+        with span("fetch"):
+            batch = await get_articles(categories, providers=providers)
+        articles = batch.articles
+        count("fetched", len(articles))
+        with span("cluster"):
+            clustered, staged_clusters = await assign_clusters(db, articles)
+        count("near_duplicates", clustered)
+        with span("content_hash"):
+            assign_content_hashes(articles)
+        with span("store"):
+            result = await store_articles(db, articles)
+        for name in ("inserted", "matched", "modified", "failed"):
+            count(name, getattr(result, name))
+        if result.failed:
+            # The next sync indexes whichever of the batch's articles did get stored
+            logger.warning(f"Not advancing fetch state after {result.failed} failed article writes")
+        else:
+            near_duplicate_index.merge(staged_clusters)
+            with span("fetch_state"):
+                await fetch_state_store.save_all(batch.states)
+        if result.inserted or result.modified:
+            article_cache.invalidate()
+        if result.inserted:
+            tagging_service.schedule(db)
+        if result.inserted_articles and settings.FEED_ENABLED:
+            try:
+                with span("feed_fanout"):
+                    count("feeds_updated", await fan_out(db, result.inserted_articles))
+            except Exception as e:
+                # Stored articles stay; affected feeds catch up on their next rebuild
+                logger.exception(f"Feed fan-out failed: {str(e)}")
+        if settings.SUMMARIZATION_ENABLED:
+            with span("summarization_enqueue"):
+                await summarization_service.enqueue(db, articles)
+        logger.info(
+            f"Ingested {len(articles)} fetched articles ({clustered} near-duplicates): {result.inserted} inserted, "
+            f"{result.matched} already stored ({result.modified} recategorized), {result.failed} failed"
+        )
+        return result
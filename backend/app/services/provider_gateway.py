@@ -0,0 +1,293 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from pymongo.errors import DuplicateKeyError
+from ..core.config import settings
+from ..db.base import get_database
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ProviderError(Exception):
+    """A provider call failed (transport error, error status or error payload)"""
+
+    def __init__(self, provider: str, message: str, status_code: Optional[int] = None):
+        super().__init__(f"{provider}: {message}")
+        self.provider = provider
+        self.status_code = status_code
+
+
+class ProviderSkipped(ProviderError):
+    """The gateway declined to make the call (circuit open, out of quota or rate limited)"""
+
+    def __init__(self, provider: str, reason: str):
+        super().__init__(provider, f"skipped, {reason}")
+        self.reason = reason
+
+
+class TokenBucket:
+    """Allows rate requests per second on average, with bursts of up to capacity"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """
+        Take a token and return how long to sleep before using it, or None (taking
+        nothing) if that would be longer than max_wait. Tokens may go negative, so
+        concurrent callers queue up behind each other in order.
+        """
+        self._refill()
+        wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+        if wait > max_wait:
+            return None
+        self.tokens -= 1
+        return wait
+
+    def refund(self):
+        """Return a reserved token that was never used"""
+        self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures and rejects calls for cooldown
+    seconds. Then a single trial call is let through (half-open): success closes the
+    breaker, failure opens it for another cooldown.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def release(self):
+        """Give back a half-open trial that was allowed but never made"""
+        self._trial_in_flight = False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def retry_in(self) -> float:
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+
+class DailyQuota:
+    """
+    Per-provider request counter for the current UTC day, persisted in the
+    provider_quotas collection so it is shared by replicas and survives restarts.
+    """
+
+    def __init__(self, provider: str, limit: Optional[int]):
+        self.provider = provider
+        self.limit = limit
+        self.exhausted_on: Optional[str] = None
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.utcnow().date().isoformat()
+
+    def _key(self, day: str) -> str:
+        return f"{self.provider}:{day}"
+
+    def exhausted(self) -> bool:
+        return self.exhausted_on == self._today()
+
+    async def consume(self, db) -> bool:
+        """Count one request against today's quota; False when none is left"""
+        if not self.limit:
+            return True
+        day = self._today()
+        if self.exhausted_on == day:
+            return False
+        query = {"_id": self._key(day), "count": {"$lt": self.limit}}
+        try:
+            await db["provider_quotas"].find_one_and_update(
+                query,
+                {"$inc": {"count": 1}, "$setOnInsert": {"provider": self.provider, "day": day}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            # Either today's document is at the limit, or a concurrent first-of-day
+            # upsert created it first; only a plain update can tell the two apart
+            pass
+        if await db["provider_quotas"].find_one_and_update(query, {"$inc": {"count": 1}}) is not None:
+            return True
+        self.exhausted_on = day
+        return False
+
+    async def exhaust(self, db):
+        """The provider says we are out (HTTP 429); stop calling it until tomorrow"""
+        day = self._today()
+        self.exhausted_on = day
+        if self.limit:
+            await db["provider_quotas"].update_one(
+                {"_id": self._key(day)},
+                {"$max": {"count": self.limit}, "$setOnInsert": {"provider": self.provider, "day": day}},
+                upsert=True
+            )
+
+    async def used(self, db) -> int:
+        doc = await db["provider_quotas"].find_one({"_id": self._key(self._today())})
+        return doc["count"] if doc else 0
+
+
+class ProviderGate:
+    def __init__(self, provider: str):
+        self.provider = provider
+        # Providers without a configured rate (e.g. RSS hosts) are not rate limited
+        rate = settings.PROVIDER_RATE_LIMITS.get(provider)
+        self.bucket = TokenBucket(rate, settings.PROVIDER_RATE_BURST) if rate else None
+        self.breaker = CircuitBreaker(
+            settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD, settings.CIRCUIT_BREAKER_COOLDOWN_SECONDS
+        )
+        self.quota = DailyQuota(provider, settings.PROVIDER_DAILY_QUOTAS.get(provider))
+        self.skipped: Dict[str, int] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def concurrency(self) -> asyncio.Semaphore:
+        """Caps the requests in flight to this provider (created lazily, on the running loop)"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(
+                settings.PROVIDER_FETCH_CONCURRENCY.get(self.provider, settings.PROVIDER_DEFAULT_FETCH_CONCURRENCY)
+            )
+        return self._semaphore
+
+    def skip(self, reason: str) -> ProviderSkipped:
+        self.skipped[reason] = self.skipped.get(reason, 0) + 1
+        logger.info(f"Skipping {self.provider}: {reason}")
+        return ProviderSkipped(self.provider, reason)
+
+
+class ProviderGateway:
+    """
+    Every provider request goes through here. A provider whose breaker is open, whose
+    daily quota is used up, or whose rate limit would make us wait longer than
+    PROVIDER_RATE_MAX_WAIT_SECONDS is skipped straight away (ProviderSkipped)
+    instead of costing a timeout or an error round trip.
+    """
+
+    def __init__(self):
+        self.gates: Dict[str, ProviderGate] = {}
+
+    def gate(self, provider: str) -> ProviderGate:
+        if provider not in self.gates:
+            self.gates[provider] = ProviderGate(provider)
+        return self.gates[provider]
+
+    def available(self, provider: str) -> bool:
+        """Cheap pre-check without touching the database or the rate limiter"""
+        gate = self.gate(provider)
+        breaker_open = gate.breaker.state == CircuitBreaker.OPEN and gate.breaker.retry_in() > 0
+        return not breaker_open and not gate.quota.exhausted()
+
+    async def call(self, provider: str, request: Callable[[], Awaitable[T]]) -> T:
+        """Make one request to provider; it should raise ProviderError on failure"""
+        gate = self.gate(provider)
+        if gate.quota.exhausted():
+            raise gate.skip("daily quota exhausted")
+        if not gate.breaker.allow():
+            raise gate.skip("circuit open")
+
+        wait = gate.bucket.reserve(settings.PROVIDER_RATE_MAX_WAIT_SECONDS) if gate.bucket else 0.0
+        if wait is None:
+            gate.breaker.release()
+            raise gate.skip("rate limited")
+
+        db = await get_database()
+        try:
+            has_quota = await gate.quota.consume(db)
+        except Exception as e:
+            # Quota bookkeeping must not take ingestion down with the database
+            logger.warning(f"Could not record quota for {provider}: {str(e)}")
+            has_quota = True
+        if not has_quota:
+            gate.breaker.release()
+            if gate.bucket:
+                gate.bucket.refund()
+            raise gate.skip("daily quota exhausted")
+
+        if wait:
+            await asyncio.sleep(wait)
+        try:
+            result = await request()
+        except ProviderError as e:
+            gate.breaker.record_failure()
+            if e.status_code == 429:
+                try:
+                    await gate.quota.exhaust(db)
+                except Exception:
+                    logger.exception(f"Could not record exhausted quota for {provider}")
+            raise
+        except Exception:
+            gate.breaker.record_failure()
+            raise
+        gate.breaker.record_success()
+        return result
+
+    async def status(self) -> Dict[str, Dict[str, Any]]:
+        db = await get_database()
+        status = {}
+        for provider, gate in self.gates.items():
+            try:
+                used = await gate.quota.used(db)
+            except Exception:
+                used = None
+            status[provider] = {
+                "circuit": gate.breaker.state,
+                "consecutive_failures": gate.breaker.failures,
+                "retry_in_seconds": round(gate.breaker.retry_in(), 1),
+                "rate_tokens": round(gate.bucket.tokens, 2) if gate.bucket else None,
+                "daily_quota": gate.quota.limit,
+                "quota_used_today": used,
+                "quota_exhausted": gate.quota.exhausted(),
+                "skipped": dict(gate.skipped),
+            }
+        return status
+
+
+provider_gateway = ProviderGateway()
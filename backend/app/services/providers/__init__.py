@@ -0,0 +1,31 @@
+"""
+News providers. To add a source, subclass JsonApiProvider (or NewsProvider, for sources
+that aren't paged JSON APIs) in a module here and register an instance below; fetching,
+source listing and category listing pick it up.
+"""
+from .base import JsonApiProvider, NewsProvider, new_article, normalize_published_date
+from .engine import FetchEngine, fetch_engine
+from .registry import ProviderRegistry, provider_registry
+from .gnews import GNewsProvider
+from .guardian import GuardianProvider
+from .mediastack import MediastackProvider
+from .newsapi import NewsAPIProvider
+from .rss import FeedParser, FeedProvider
+
+provider_registry.register(NewsAPIProvider())
+provider_registry.register(GNewsProvider())
+provider_registry.register(GuardianProvider())
+provider_registry.register(MediastackProvider())
+provider_registry.register(FeedProvider())
+
+__all__ = [
+    "FeedParser",
+    "JsonApiProvider",
+    "NewsProvider",
+    "new_article",
+    "normalize_published_date",
+    "FetchEngine",
+    "fetch_engine",
+    "ProviderRegistry",
+    "provider_registry",
+]
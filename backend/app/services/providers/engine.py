@@ -0,0 +1,178 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+import httpx
+from ...core.config import settings
+from ...core.tracing import count, span
+from ..fetch_state import FetchBatch, fetch_state_store
+from ..http_client import get_http_client
+from ..provider_gateway import ProviderError, ProviderSkipped, provider_gateway
+from .base import JsonApiProvider, NewsProvider
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _transient(error: ProviderError) -> bool:
+    """Transport errors and 5xx are worth another attempt; 4xx and gateway skips are not"""
+    if isinstance(error, ProviderSkipped):
+        return False
+    return error.status_code is None or error.status_code >= 500
+
+
+class FetchEngine:
+    """
+    Fetches from any NewsProvider: one query per provider category (at most the provider's
+    fetch concurrency at a time). JSON APIs are paged up to PROVIDER_MAX_PAGES, asking only
+    for what is newer than the stored fetch state. Every request goes through the provider
+    gateway on the provider's pooled client.
+    """
+
+    async def fetch(
+        self,
+        provider: NewsProvider,
+        categories: Optional[List[str]] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> FetchBatch:
+        """
+        Fetch the provider's articles for categories, with the fetch states to save after
+        storing them. Failed queries are logged and left out; ProviderError is raised
+        only when every query failed.
+        """
+        client = client or get_http_client(provider.id)
+        gate = provider_gateway.gate(provider.id)
+        queries = provider.queries(categories)
+
+        async def run(query: Optional[str], attributed: List[str]) -> FetchBatch:
+            async with gate.concurrency():
+                try:
+                    return await provider.fetch_query(self, client, query, attributed)
+                except ProviderError:
+                    raise
+                except Exception as e:
+                    logger.exception(f"Error fetching {query or 'headlines'} from {provider.id}: {str(e)}")
+                    raise ProviderError(provider.id, str(e)) from e
+
+        with span("provider", provider=provider.id, queries=len(queries)):
+            results = await asyncio.gather(
+                *(run(q, attributed) for q, attributed in queries.items()), return_exceptions=True
+            )
+
+        batch = FetchBatch()
+        errors: List[BaseException] = []
+        for result in results:
+            if isinstance(result, ProviderSkipped):
+                count("queries_skipped", provider=provider.id)
+                continue
+            if isinstance(result, BaseException):
+                errors.append(result)
+                continue
+            batch.extend(result)
+        count("queries", len(results), provider=provider.id)
+        count("queries_failed", len(errors), provider=provider.id)
+        count("articles", len(batch.articles), provider=provider.id)
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        for error in errors:
+            logger.error(f"Error fetching articles: {str(error)}")
+        logger.info(f"Retrieved {len(batch.articles)} articles from {provider.name}")
+        return batch
+
+    async def call(self, gate: str, send: Callable[[], Awaitable[T]]) -> T:
+        """
+        Make a request through the gateway under the given gate name (usually the provider
+        id), retried with backoff on transient errors. Each attempt is gated and counted.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await provider_gateway.call(gate, send)
+            except ProviderError as e:
+                if attempt >= settings.PROVIDER_RETRIES or not _transient(e):
+                    raise
+                attempt += 1
+                delay = settings.PROVIDER_RETRY_BACKOFF_SECONDS * (2 ** (attempt - 1))
+                logger.info(f"Retrying {gate} in {delay:.1f}s after: {str(e)}")
+                await asyncio.sleep(delay)
+
+    async def request(
+        self,
+        provider: JsonApiProvider,
+        client: httpx.AsyncClient,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        """One JSON API request to the provider. Returns 200 and 304 responses, raises ProviderError otherwise."""
+        async def send() -> httpx.Response:
+            try:
+                with span("http", provider=provider.id) as attributes:
+                    response = await client.get(provider.url, params=params, headers=headers)
+                    attributes["status"] = response.status_code
+            except httpx.HTTPError as e:
+                raise ProviderError(provider.id, f"{type(e).__name__}: {str(e)}") from e
+            count("requests", provider=provider.id)
+            count("bytes", len(response.content), provider=provider.id)
+            if response.status_code not in (200, 304):
+                logger.error(f"{provider.id} error: {response.status_code} - {response.text}")
+                raise ProviderError(provider.id, f"HTTP {response.status_code}", response.status_code)
+            return response
+
+        return await self.call(provider.id, send)
+
+    async def fetch_pages(
+        self,
+        provider: JsonApiProvider,
+        client: httpx.AsyncClient,
+        query: Optional[str],
+        attributed: List[str]
+    ) -> FetchBatch:
+        """
+        Page through one JSON API query, asking only for what is newer than its fetch state.
+        The updated state is returned unsaved, with the articles it covers.
+        """
+        state = await fetch_state_store.load(provider.id, query or "*")
+        since = state.newest_published or provider.default_since()
+
+        articles = []
+        first_response = None
+        for page in range(1, max(1, settings.PROVIDER_MAX_PAGES.get(provider.id, 1)) + 1):
+            response = await self.request(
+                provider, client, provider.build_params(query, state.newest_published, page),
+                state.conditional_headers(since) if page == 1 else None
+            )
+            if response.status_code == 304:
+                logger.info(f"{provider.name} {query or 'headlines'}: nothing new since the last fetch")
+                return FetchBatch()
+            first_response = first_response or response
+
+            with span("parse", provider=provider.id) as attributes:
+                data = response.json()
+                provider.check(data)
+                items = provider.items(data)
+                reached_known = False
+                dropped = 0
+                for item in items:
+                    article = provider.normalize(item, attributed)
+                    if article is None:
+                        dropped += 1
+                        continue
+                    if (provider.filters_since_locally and state.newest_published
+                            and article["published_date"] < state.newest_published):
+                        reached_known = True
+                        dropped += 1
+                        continue
+                    articles.append(article)
+                attributes["items"] = len(items)
+            count("items", len(items), provider=provider.id)
+            count("dropped", dropped, provider=provider.id)
+
+            if reached_known or not provider.has_more(data, page, len(items)):
+                break
+
+        state.record(first_response, articles, since)
+        return FetchBatch(articles, [state])
+
+
+fetch_engine = FetchEngine()
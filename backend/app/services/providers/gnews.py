@@ -0,0 +1,62 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ...core.config import settings
+from ..fetch_state import format_since
+from .base import JsonApiProvider, new_article, normalize_published_date
+
+
+class GNewsProvider(JsonApiProvider):
+    id = "gnews"
+    name = "GNews API"
+    source_label = "GNews"
+    description = "Searchable and real-time news data from various sources around the web."
+    api_key_setting = "GNEWS_API_KEY"
+    url = "https://gnews.io/api/v4/top-headlines"
+    # Paging beyond the first page needs a paid GNews plan, hence PROVIDER_MAX_PAGES of 1
+    page_size = 10
+    categories = {
+        "business": "business",
+        "entertainment": "entertainment",
+        "health": "health",
+        "science": "science",
+        "sports": "sports",
+        "technology": "technology",
+        "world": "world",
+        "nation": "nation",
+    }
+
+    def build_params(self, query: Optional[str], since: Optional[datetime], page: int) -> Dict[str, Any]:
+        params = {
+            "token": settings.GNEWS_API_KEY,
+            "lang": "en",
+            "country": "us",
+            "max": self.page_size,
+            "page": page,
+        }
+        if query:
+            params["topic"] = query
+        if since:
+            params["from"] = format_since(since)
+        return params
+
+    def items(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return data.get("articles", [])
+
+    def normalize(self, item: Dict[str, Any], categories: List[str]) -> Optional[Dict[str, Any]]:
+        if not item.get("url") or not item.get("title"):
+            return None
+        return new_article(
+            title=item.get("title", "Untitled"),
+            source=(item.get("source") or {}).get("name", self.source_label),
+            source_url=item.get("url", ""),
+            author=None,  # GNews doesn't provide author info
+            published_date=normalize_published_date(item.get("publishedAt")),
+            synopsis=item.get("description", ""),
+            content=item.get("content", ""),
+            image_url=item.get("image"),
+            categories=list(categories),
+        )
+
+    def has_more(self, data: Dict[str, Any], page: int, item_count: int) -> bool:
+        return item_count >= self.page_size and page * self.page_size < data.get("totalArticles", 0)
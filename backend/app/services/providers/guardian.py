@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ...core.config import settings
+from ..fetch_state import format_since
+from .base import JsonApiProvider, new_article, normalize_published_date
+
+
+class GuardianProvider(JsonApiProvider):
+    id = "guardian"
+    name = "The Guardian"
+    source_label = "The Guardian"
+    description = "Open platform for accessing Guardian content, providing a rich set of articles."
+    api_key_setting = "GUARDIAN_API_KEY"
+    url = "https://content.guardianapis.com/search"
+    page_size = 10
+    categories = {
+        "business": "business",
+        "technology": "technology",
+        "sports": "sport",
+        "politics": "politics",
+        "science": "science",
+        "health": "society",
+        "culture": "culture",
+        "entertainment": "culture",
+        "fashion": "fashion",
+        "environment": "environment",
+        "world": "world",
+    }
+
+    def build_params(self, query: Optional[str], since: Optional[datetime], page: int) -> Dict[str, Any]:
+        params = {
+            "api-key": settings.GUARDIAN_API_KEY,
+            "show-fields": "headline,byline,thumbnail,trailText,bodyText,publication",
+            "page-size": self.page_size,
+            "order-by": "newest",
+            "page": page,
+        }
+        if query:
+            params["section"] = query
+        if since:
+            params["from-date"] = format_since(since)
+        return params
+
+    def items(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return data.get("response", {}).get("results", [])
+
+    def normalize(self, item: Dict[str, Any], categories: List[str]) -> Optional[Dict[str, Any]]:
+        if not item.get("webUrl") or not item.get("webTitle"):
+            return None
+        fields = item.get("fields", {})
+        return new_article(
+            title=fields.get("headline", item.get("webTitle", "Untitled")),
+            source=self.source_label,
+            source_url=item.get("webUrl", ""),
+            author=fields.get("byline"),
+            published_date=normalize_published_date(item.get("webPublicationDate")),
+            synopsis=fields.get("trailText", ""),
+            content=fields.get("bodyText", ""),
+            image_url=fields.get("thumbnail"),
+            # Unfiltered queries fall back to the Guardian's own section name
+            categories=list(categories) or [item.get("sectionName")],
+        )
+
+    def has_more(self, data: Dict[str, Any], page: int, item_count: int) -> bool:
+        return item_count >= self.page_size and page < data.get("response", {}).get("pages", 0)
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from ...core.config import settings
+from ..fetch_state import format_since
+from ..provider_gateway import ProviderError
+from .base import JsonApiProvider, new_article, normalize_published_date
+
+
+class NewsAPIProvider(JsonApiProvider):
+    id = "newsapi"
+    name = "NewsAPI.org"
+    source_label = "NewsAPI"
+    description = "Provides breaking news headlines and search for articles from over 80,000 sources."
+    api_key_setting = "NEWSAPI_API_KEY"
+    url = "https://newsapi.org/v2/top-headlines"
+    page_size = 20
+    categories = {
+        category: category
+        for category in ["business", "entertainment", "general", "health", "science", "sports", "technology"]
+    }
+    # top-headlines ignores "from", so the engine drops already fetched items itself
+    filters_since_locally = True
+
+    def default_since(self) -> Optional[datetime]:
+        return datetime.utcnow() - timedelta(days=7)
+
+    def build_params(self, query: Optional[str], since: Optional[datetime], page: int) -> Dict[str, Any]:
+        # Never reach further back than the 7-day window
+        since = max(since or self.default_since(), self.default_since())
+        params = {
+            "apiKey": settings.NEWSAPI_API_KEY,
+            "language": "en",
+            "sortBy": "publishedAt",
+            "from": format_since(since),
+            "pageSize": self.page_size,
+            "page": page,
+        }
+        if query:
+            params["category"] = query
+        return params
+
+    def check(self, data: Dict[str, Any]):
+        if data.get("status") != "ok":
+            raise ProviderError(self.id, f"status {data.get('status')}: {data.get('code')}")
+
+    def items(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return data.get("articles", [])
+
+    def normalize(self, item: Dict[str, Any], categories: List[str]) -> Optional[Dict[str, Any]]:
+        if not item.get("url") or not item.get("title"):
+            return None
+        return new_article(
+            title=item.get("title", "Untitled"),
+            source=(item.get("source") or {}).get("name", self.source_label),
+            source_url=item.get("url", ""),
+            author=item.get("author"),
+            published_date=normalize_published_date(item.get("publishedAt")),
+            synopsis=item.get("description", ""),
+            content=item.get("content", ""),
+            image_url=item.get("urlToImage"),
+            categories=list(categories),
+        )
+
+    def has_more(self, data: Dict[str, Any], page: int, item_count: int) -> bool:
+        return item_count >= self.page_size and page * self.page_size < data.get("totalResults", 0)
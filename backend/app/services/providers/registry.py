@@ -0,0 +1,61 @@
+from typing import Any, Dict, List, Optional
+
+from .base import NewsProvider
+
+# The categories the UI offers, in display order, with their display names. Providers may
+# map more (e.g. "general", "nation"); those are fetched but not listed.
+CATEGORY_NAMES = {
+    "business": "Business",
+    "technology": "Technology",
+    "entertainment": "Entertainment",
+    "health": "Health",
+    "science": "Science",
+    "sports": "Sports",
+    "world": "World",
+    "politics": "Politics",
+    "environment": "Environment",
+    "culture": "Culture",
+}
+
+
+class ProviderRegistry:
+    """Every news provider, in registration order; drives fetching and the source/category listings"""
+
+    def __init__(self):
+        self._providers: Dict[str, NewsProvider] = {}
+
+    def register(self, provider: NewsProvider) -> NewsProvider:
+        if provider.id in self._providers:
+            raise ValueError(f"Provider {provider.id} is already registered")
+        self._providers[provider.id] = provider
+        return provider
+
+    def get(self, provider_id: str) -> Optional[NewsProvider]:
+        return self._providers.get(provider_id)
+
+    def all(self) -> List[NewsProvider]:
+        return list(self._providers.values())
+
+    def enabled(self) -> List[NewsProvider]:
+        return [provider for provider in self._providers.values() if provider.enabled]
+
+    def sources(self) -> List[Dict[str, Any]]:
+        return [provider.describe() for provider in self._providers.values()]
+
+    def categories(self) -> List[Dict[str, Any]]:
+        """The listed categories some provider serves, each with the providers that can fetch it"""
+        sources: Dict[str, List[str]] = {}
+        for provider in self._providers.values():
+            for category in provider.categories:
+                sources.setdefault(category, []).append(provider.id)
+        return [
+            {"id": category, "name": name, "sources": sources[category]}
+            for category, name in CATEGORY_NAMES.items()
+            if category in sources
+        ]
+
+    def source_labels(self) -> Dict[str, str]:
+        return {provider.id: provider.source_label for provider in self._providers.values()}
+
+
+provider_registry = ProviderRegistry()
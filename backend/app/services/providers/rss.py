@@ -0,0 +1,244 @@
+import html
+import logging
+import re
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+import httpx
+from ...core.config import settings
+from ...core.tracing import count, span
+from ..fetch_state import FetchBatch, fetch_state_store
+from ..provider_gateway import ProviderError
+from .base import NewsProvider, new_article, normalize_published_date
+
+if TYPE_CHECKING:
+    from .engine import FetchEngine
+
+logger = logging.getLogger(__name__)
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+ENTRY_TAGS = {"item", "entry"}
+FEED_TAGS = {"channel", "feed"}
+
+
+def _local(tag: str) -> str:
+    """Tag name without its namespace, e.g. {http://www.w3.org/2005/Atom}entry -> entry"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text(value: Optional[str]) -> str:
+    """Plain text from a feed field that may hold escaped HTML"""
+    return " ".join(html.unescape(TAG_PATTERN.sub(" ", value or "")).split())
+
+
+class FeedParser:
+    """
+    Incremental RSS 2.0 / RSS 1.0 / Atom parser. Feed it bytes as they arrive and it
+    yields one dict per completed item/entry. Finished entries are detached from the
+    tree, so memory stays bounded by the largest entry rather than the whole document.
+    """
+
+    def __init__(self):
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._stack: List[Element] = []
+        self.feed_title: Optional[str] = None
+
+    def feed(self, data: bytes) -> Iterator[Dict[str, Any]]:
+        self._parser.feed(data)
+        return self._events()
+
+    def close(self) -> Iterator[Dict[str, Any]]:
+        self._parser.close()
+        return self._events()
+
+    def _events(self) -> Iterator[Dict[str, Any]]:
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._stack.append(element)
+                continue
+            self._stack.pop()
+            name = _local(element.tag)
+            parent = _local(self._stack[-1].tag) if self._stack else None
+            if name == "title" and parent in FEED_TAGS and self.feed_title is None:
+                self.feed_title = _text(element.text)
+            elif name in ENTRY_TAGS:
+                yield self._entry(element)
+                if self._stack:
+                    self._stack[-1].remove(element)
+                element.clear()
+
+    @staticmethod
+    def _entry(element: Element) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"categories": []}
+        for child in element:
+            name = _local(child.tag)
+            text = (child.text or "").strip()
+            if name == "title":
+                entry["title"] = _text(text)
+            elif name == "link":
+                # Atom links carry href; prefer rel="alternate" (or no rel) over others
+                href = child.get("href")
+                if href is None:
+                    entry.setdefault("link", text)
+                elif child.get("rel", "alternate") == "alternate":
+                    entry["link"] = href
+            elif name == "guid" and text.startswith("http") and child.get("isPermaLink", "true") != "false":
+                entry.setdefault("guid", text)
+            elif name in ("enclosure", "content", "thumbnail") and child.get("url"):
+                # media:content / media:thumbnail / image enclosures
+                if name != "enclosure" or (child.get("type") or "").startswith("image/"):
+                    entry.setdefault("image", child.get("url"))
+            elif name in ("description", "summary"):
+                entry["summary"] = text
+            elif name in ("encoded", "content"):
+                entry["content"] = text
+            elif name in ("pubDate", "published", "date"):
+                entry["published"] = text
+            elif name == "updated":
+                entry.setdefault("updated", text)
+            elif name in ("author", "creator"):
+                author_name = next((c.text for c in child if _local(c.tag) == "name"), None)
+                entry.setdefault("author", (author_name or text).strip() or None)
+            elif name == "category":
+                label = child.get("term") or text
+                if label:
+                    entry["categories"].append(label)
+            elif name == "group":
+                # media:group wrapping media:content / media:thumbnail
+                for media in child:
+                    if media.get("url") and _local(media.tag) in ("content", "thumbnail"):
+                        entry.setdefault("image", media.get("url"))
+        if not entry.get("link") and entry.get("guid"):
+            entry["link"] = entry["guid"]
+        return entry
+
+
+class FeedProvider(NewsProvider):
+    """
+    Key-free RSS/Atom feeds from settings.RSS_FEEDS. Each feed is its own query: streamed
+    through FeedParser, fetched conditionally with the feed's ETag/Last-Modified, and
+    gated per host, so one broken feed cannot open the breaker for the others.
+    """
+
+    id = "rss"
+    name = "RSS/Atom feeds"
+    source_label = "RSS"
+    description = "Articles from configured RSS and Atom feeds."
+
+    @property
+    def feeds(self) -> Dict[str, Dict[str, Any]]:
+        return {feed["url"]: feed for feed in settings.RSS_FEEDS if feed.get("url")}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(settings.RSS_FEEDS)
+
+    @property
+    def categories(self) -> Dict[str, str]:
+        categories: Dict[str, str] = {}
+        for feed in settings.RSS_FEEDS:
+            for category in feed.get("categories", []):
+                categories[category.lower()] = category.lower()
+        return categories
+
+    def queries(self, categories: Optional[List[str]]) -> Dict[Optional[str], List[str]]:
+        """
+        One query per feed serving any of the categories. A feed is a single resource
+        whatever category asked for it, so its articles get all of the feed's categories.
+        """
+        wanted = {c.lower() for c in categories} if categories else None
+        queries: Dict[Optional[str], List[str]] = {}
+        for url, feed in self.feeds.items():
+            feed_categories = [c.lower() for c in feed.get("categories", [])]
+            if wanted is None or wanted.intersection(feed_categories):
+                queries[url] = feed_categories
+        return queries
+
+    def to_article(self, entry: Dict[str, Any], source: str, categories: List[str]) -> Optional[Dict[str, Any]]:
+        if not entry.get("link") or not entry.get("title"):
+            return None
+        content = _text(entry.get("content") or entry.get("summary"))
+        return new_article(
+            title=entry["title"],
+            source=source,
+            source_url=entry["link"],
+            author=entry.get("author"),
+            published_date=normalize_published_date(entry.get("published") or entry.get("updated")),
+            synopsis=_text(entry.get("summary"))[:1000],
+            content=content,
+            image_url=entry.get("image"),
+            categories=list(categories),
+        )
+
+    async def fetch_query(
+        self,
+        engine: "FetchEngine",
+        client: httpx.AsyncClient,
+        query: Optional[str],
+        categories: List[str]
+    ) -> FetchBatch:
+        url = query
+        feed = self.feeds.get(url, {})
+        state = await fetch_state_store.load(self.id, url)
+
+        async def send() -> Optional[List[Dict[str, Any]]]:
+            try:
+                async with client.stream("GET", url, headers=state.conditional_headers(None)) as response:
+                    if response.status_code == 304:
+                        return None
+                    if response.status_code != 200:
+                        raise ProviderError(self.id, f"{url}: HTTP {response.status_code}", response.status_code)
+                    articles = await self._parse(response, feed, categories, state.newest_published)
+                    state.record(response, articles, None)
+                    return articles
+            except httpx.HTTPError as e:
+                raise ProviderError(self.id, f"{url}: {type(e).__name__}: {str(e)}") from e
+            except ParseError as e:
+                raise ProviderError(self.id, f"{url}: invalid feed: {str(e)}") from e
+
+        with span("feed", provider=self.id, url=url):
+            articles = await engine.call(f"{self.id}:{urlparse(url).netloc}", send)
+        if articles is None:
+            logger.debug(f"Feed {url} not modified")
+            return FetchBatch()
+        return FetchBatch(articles, [state])
+
+    async def _parse(
+        self,
+        response: httpx.Response,
+        feed: Dict[str, Any],
+        categories: List[str],
+        newest_published
+    ) -> List[Dict[str, Any]]:
+        parser = FeedParser()
+        articles: List[Dict[str, Any]] = []
+        received = 0
+
+        def collect(entries) -> bool:
+            """Add parsed entries; False once the per-feed entry cap is reached"""
+            for entry in entries:
+                source = feed.get("name") or parser.feed_title or urlparse(str(response.url)).netloc
+                article = self.to_article(entry, source, categories)
+                # Entries we already stored on an earlier fetch of this feed
+                if article is None or (newest_published and article["published_date"] < newest_published):
+                    continue
+                articles.append(article)
+                if len(articles) >= settings.RSS_MAX_ENTRIES_PER_FEED:
+                    return False
+            return True
+
+        try:
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if received > settings.RSS_MAX_BYTES:
+                    logger.warning(f"Feed {response.url} exceeds {settings.RSS_MAX_BYTES} bytes; keeping the first entries")
+                    return articles
+                if not collect(parser.feed(chunk)):
+                    return articles
+            collect(parser.close())
+            return articles
+        finally:
+            count("requests", provider=self.id)
+            count("bytes", received, provider=self.id)
+            count("items", len(articles), provider=self.id)
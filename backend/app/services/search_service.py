@@ -0,0 +1,218 @@
+import re
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from ..core.config import settings
+from ..db.indexes import SEARCH_WEIGHTS
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "in",
+    "is", "it", "its", "of", "on", "or", "that", "the", "to", "was", "were", "with",
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+QUERY_PATTERN = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in TOKEN_PATTERN.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+class SearchQuery:
+    """
+    A parsed search string using Mongo $text syntax: bare words match any,
+    "quoted phrases" must all appear, and -word / -"phrase" exclude.
+    """
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.terms: List[str] = []
+        self.phrases: List[List[str]] = []
+        self.excluded_terms: List[str] = []
+        self.excluded_phrases: List[List[str]] = []
+
+        for negated, phrase, word in QUERY_PATTERN.findall(raw or ""):
+            if phrase:
+                tokens = tokenize(phrase)
+                if tokens:
+                    (self.excluded_phrases if negated else self.phrases).append(tokens)
+            elif word.startswith("-") and len(word) > 1:
+                self.excluded_terms.extend(tokenize(word[1:]))
+            else:
+                self.terms.extend(tokenize(word))
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.terms and not self.phrases
+
+
+class InvertedIndex:
+    """
+    Pure-Python positional inverted index over title/synopsis/content with the
+    same query semantics and field weights as the Mongo text index.
+    Used where $text is unavailable (tests, mongomock, local experiments).
+    """
+
+    def __init__(self, weights: Optional[Dict[str, int]] = None):
+        self.weights = weights or SEARCH_WEIGHTS
+        # term -> doc id -> field -> positions
+        self.postings: Dict[str, Dict[str, Dict[str, List[int]]]] = defaultdict(dict)
+        self.documents: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, doc_id: str, document: Dict[str, Any]):
+        self.remove(doc_id)
+        terms: Set[str] = set()
+        for field in self.weights:
+            for position, token in enumerate(tokenize(document.get(field) or "")):
+                self.postings[token].setdefault(doc_id, {}).setdefault(field, []).append(position)
+                terms.add(token)
+        self.documents[doc_id] = terms
+
+    def remove(self, doc_id: str):
+        for term in self.documents.pop(doc_id, ()):
+            self.postings[term].pop(doc_id, None)
+            if not self.postings[term]:
+                del self.postings[term]
+
+    def _has_phrase(self, doc_id: str, phrase: List[str]) -> bool:
+        first = self.postings.get(phrase[0], {}).get(doc_id, {})
+        for field, positions in first.items():
+            for start in positions:
+                if all(
+                    start + offset in self.postings.get(token, {}).get(doc_id, {}).get(field, ())
+                    for offset, token in enumerate(phrase[1:], 1)
+                ):
+                    return True
+        return False
+
+    def _score(self, doc_id: str, tokens: List[str]) -> float:
+        score = 0.0
+        for token in tokens:
+            for field, positions in self.postings.get(token, {}).get(doc_id, {}).items():
+                score += self.weights[field] * len(positions)
+        return score
+
+    def search(self, query: SearchQuery) -> List[Tuple[str, float]]:
+        """Return (doc id, relevance score) pairs, best first"""
+        if query.is_empty:
+            return []
+
+        if query.terms:
+            candidates = set()
+            for term in query.terms:
+                candidates.update(self.postings.get(term, {}))
+        else:
+            candidates = set(self.postings.get(query.phrases[0][0], {}))
+
+        for phrase in query.phrases:
+            candidates = {d for d in candidates if self._has_phrase(d, phrase)}
+        for term in query.excluded_terms:
+            candidates.difference_update(self.postings.get(term, {}))
+        for phrase in query.excluded_phrases:
+            candidates = {d for d in candidates if not self._has_phrase(d, phrase)}
+
+        scoring_tokens = query.terms + [t for phrase in query.phrases for t in phrase]
+        results = [(doc_id, self._score(doc_id, scoring_tokens)) for doc_id in candidates]
+        results.sort(key=lambda r: r[1], reverse=True)
+        return results
+
+
+class MemorySearchBackend:
+    """
+    Keeps an InvertedIndex in sync with the articles collection by pulling
+    articles created or updated since the last sync before each search, and
+    dropping deleted ones every SEARCH_MEMORY_RECONCILE_SECONDS.
+    """
+
+    def __init__(self):
+        self.index = InvertedIndex()
+        self.synced_until: Optional[datetime] = None
+        self.reconciled_at = 0.0
+
+    async def sync(self, db: AsyncIOMotorDatabase):
+        full = self.synced_until is None
+        query = {} if full else {"updated_at": {"$gte": self.synced_until}}
+        projection = {"_id": 0, "id": 1, "updated_at": 1, **{f: 1 for f in SEARCH_WEIGHTS}}
+        async for doc in db["articles"].find(query, projection):
+            self.index.add(doc["id"], doc)
+            updated_at = doc.get("updated_at")
+            if updated_at and (self.synced_until is None or updated_at > self.synced_until):
+                self.synced_until = updated_at
+
+        if full:
+            self.reconciled_at = time.monotonic()
+        elif time.monotonic() - self.reconciled_at >= settings.SEARCH_MEMORY_RECONCILE_SECONDS:
+            await self.drop_deleted(db)
+
+    async def drop_deleted(self, db: AsyncIOMotorDatabase):
+        stored = {doc["id"] async for doc in db["articles"].find({}, {"_id": 0, "id": 1})}
+        for doc_id in set(self.index.documents) - stored:
+            self.index.remove(doc_id)
+        self.reconciled_at = time.monotonic()
+
+    async def search(
+        self,
+        db: AsyncIOMotorDatabase,
+        query: SearchQuery,
+        filter_query: Dict[str, Any],
+        skip: int,
+        limit: int,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        await self.sync(db)
+        ranked = self.index.search(query)
+        wanted = skip + limit
+        if not ranked or wanted <= 0:
+            return []
+
+        # Look up ranked ids a page at a time so only the top matches that pass
+        # the filters are loaded, not every article containing a term
+        docs: List[Dict[str, Any]] = []
+        for start in range(0, len(ranked), wanted):
+            scores = dict(ranked[start:start + wanted])
+            page = await db["articles"].find(
+                {**filter_query, "id": {"$in": list(scores)}},
+                {**projection, "id": 1} if projection else None
+            ).to_list(length=len(scores))
+            for doc in page:
+                doc["score"] = scores[doc["id"]]
+            page.sort(key=lambda d: d["score"], reverse=True)
+            docs.extend(page)
+            if len(docs) >= wanted:
+                break
+        return docs[skip:wanted]
+
+
+memory_search = MemorySearchBackend()
+
+
+async def search_articles(
+    db: AsyncIOMotorDatabase,
+    search: str,
+    filter_query: Dict[str, Any],
+    skip: int = 0,
+    limit: int = 20,
+    projection: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Full-text search over articles, best match first, with each result's relevance in "score".
+    Uses the weighted Mongo text index unless SEARCH_BACKEND is "memory".
+    """
+    query = SearchQuery(search)
+    if query.is_empty:
+        return []
+
+    if settings.SEARCH_BACKEND == "memory":
+        return await memory_search.search(db, query, filter_query, skip, limit, projection)
+
+    cursor = db["articles"].find(
+        {**filter_query, "$text": {"$search": search}},
+        {**(projection or {}), "score": {"$meta": "textScore"}}
+    ).sort([("score", {"$meta": "textScore"})]).skip(skip).limit(limit)
+    return await cursor.to_list(length=limit)
@@ -0,0 +1,305 @@
+import asyncio
+import hashlib
+import logging
+import math
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ReturnDocument, UpdateMany, UpdateOne
+from ..core.config import settings
+from ..db.base import get_database
+
+logger = logging.getLogger(__name__)
+
+# NewsAPI/GNews append "… [+1234 chars]" to truncated content
+TRUNCATION_MARKER = re.compile(r"\s*(…|\.\.\.)?\s*\[\+\d+ chars\]\s*$")
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+SENTENCE_PATTERN = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'])")
+
+
+def clean_content(text: Optional[str]) -> str:
+    return " ".join(TRUNCATION_MARKER.sub("", text or "").split())
+
+
+def content_hash(article: Dict[str, Any]) -> Optional[str]:
+    """
+    Hash of the normalized article body, shared by the same story fetched from
+    several providers or on every refresh. None when there is too little to summarize.
+    """
+    content = clean_content(article.get("content"))
+    if len(content) < settings.SUMMARIZATION_MIN_CHARS:
+        return None
+    return hashlib.sha256(content.lower().encode("utf-8")).hexdigest()
+
+
+def split_sentences(text: str) -> List[str]:
+    try:
+        from nltk.tokenize import sent_tokenize
+        return sent_tokenize(text)
+    except (ImportError, LookupError):
+        # punkt data not downloaded; a punctuation split is close enough for news prose
+        return SENTENCE_PATTERN.split(text)
+
+
+class TextRankSummarizer:
+    """Extractive TextRank: PageRank over a sentence graph weighted by word overlap"""
+
+    def __init__(self, sentences: int, damping: float = 0.85, iterations: int = 30):
+        self.sentences = sentences
+        self.damping = damping
+        self.iterations = iterations
+
+    @staticmethod
+    def _similarity(left: set, right: set) -> float:
+        if len(left) < 2 or len(right) < 2:
+            return 0.0
+        return len(left & right) / (math.log(len(left)) + math.log(len(right)))
+
+    def summarize(self, text: str) -> str:
+        sentences = [s.strip() for s in split_sentences(clean_content(text)) if s.strip()]
+        if len(sentences) <= self.sentences:
+            return " ".join(sentences)
+
+        words = [set(WORD_PATTERN.findall(s.lower())) for s in sentences]
+        count = len(sentences)
+        weights = [[self._similarity(words[i], words[j]) if i != j else 0.0 for j in range(count)]
+                   for i in range(count)]
+        totals = [sum(row) for row in weights]
+
+        scores = [1.0] * count
+        for _ in range(self.iterations):
+            scores = [
+                (1 - self.damping) + self.damping * sum(
+                    weights[j][i] / totals[j] * scores[j] for j in range(count) if totals[j]
+                )
+                for i in range(count)
+            ]
+
+        top = sorted(range(count), key=lambda i: scores[i], reverse=True)[:self.sentences]
+        return " ".join(sentences[i] for i in sorted(top))
+
+
+class TransformerSummarizer:
+    """Local abstractive summarizer via a transformers summarization pipeline"""
+
+    def __init__(self, model: str):
+        from transformers import pipeline  # Heavy import, only in workers that use it
+        self.pipeline = pipeline("summarization", model=model)
+
+    def summarize(self, text: str) -> str:
+        output = self.pipeline(clean_content(text)[:4000], max_length=130, min_length=30, truncation=True)
+        return output[0]["summary_text"].strip()
+
+
+@lru_cache(maxsize=None)
+def _get_summarizer(backend: str):
+    """Load the summarizer once per worker process, on first use"""
+    if backend == "transformer":
+        return TransformerSummarizer(settings.SUMMARIZATION_MODEL)
+    return TextRankSummarizer(settings.SUMMARIZATION_SENTENCES)
+
+
+def _summarize(backend: str, text: str) -> str:
+    """Process pool entry point"""
+    return _get_summarizer(backend).summarize(text)
+
+
+class SummarizationService:
+    """
+    Summaries are memoized in the summarization_jobs collection, keyed by content hash,
+    which doubles as a persistent job queue. A claimer leases pending jobs into a bounded
+    asyncio queue (blocking when workers fall behind) and worker tasks run the model on a
+    process pool, then copy the summary onto every article with that content hash.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        if not settings.SUMMARIZATION_ENABLED:
+            logger.info("Summarization disabled")
+            return
+        self._executor = self._new_executor()
+        self._queue = asyncio.Queue(maxsize=settings.SUMMARIZATION_QUEUE_SIZE)
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._claim_loop())] + [
+            asyncio.create_task(self._worker()) for _ in range(settings.SUMMARIZATION_WORKERS)
+        ]
+        logger.info(f"Summarization started with {settings.SUMMARIZATION_WORKERS} workers")
+
+    @staticmethod
+    def _new_executor() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=settings.SUMMARIZATION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _replace_executor(self, broken: ProcessPoolExecutor):
+        """Swap a broken pool for a new one, once even when several workers saw it break"""
+        if self._executor is broken:
+            logger.warning("Summarization process pool broke; starting a new one")
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._new_executor()
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def enqueue(self, db: AsyncIOMotorDatabase, articles: List[Dict[str, Any]]) -> int:
+        """
+        Queue a job per distinct content hash (articles must already carry "content_hash").
+        Hashes that were summarized before are applied straight away. Returns the number of new jobs.
+        """
+        hashes = {a["content_hash"] for a in articles if a.get("content_hash")}
+        if not hashes:
+            return 0
+
+        now = datetime.utcnow()
+        result = await db["summarization_jobs"].bulk_write([
+            UpdateOne(
+                {"_id": h},
+                {"$setOnInsert": {"status": "pending", "attempts": 0, "created_at": now, "updated_at": now}},
+                upsert=True
+            )
+            for h in hashes
+        ], ordered=False)
+
+        # Memoized results: refetched or cross-provider copies of already summarized stories
+        done = await db["summarization_jobs"].find(
+            {"_id": {"$in": list(hashes)}, "status": "done"}, {"summary": 1}
+        ).to_list(length=None)
+        if done:
+            await db["articles"].bulk_write([
+                UpdateMany({"content_hash": job["_id"], "summary": None}, {"$set": {"summary": job["summary"]}})
+                for job in done
+            ], ordered=False)
+
+        if result.upserted_count and self._wakeup is not None:
+            self._wakeup.set()
+        return result.upserted_count
+
+    async def _claim(self, db: AsyncIOMotorDatabase) -> Optional[Dict[str, Any]]:
+        now = datetime.utcnow()
+        return await db["summarization_jobs"].find_one_and_update(
+            {"$or": [
+                {"status": "pending", "not_before": None},
+                # Failed jobs waiting out their retry backoff
+                {"status": "pending", "not_before": {"$lte": now}},
+                # Jobs whose worker died mid-run
+                {"status": "running", "lease_until": {"$lt": now}},
+            ]},
+            {
+                "$set": {
+                    "status": "running",
+                    "lease_until": now + timedelta(seconds=settings.SUMMARIZATION_LEASE_SECONDS),
+                    "updated_at": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+
+    async def _claim_loop(self):
+        while True:
+            try:
+                db = await get_database()
+                job = await self._claim(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Claiming summarization job failed: {str(e)}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=settings.SUMMARIZATION_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            # Blocks while the queue is full, so claiming never outpaces the workers
+            await self._queue.put(job)
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            db = await get_database()
+            try:
+                await self._process(db, loop, job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Summarization job {job['_id']} failed: {str(e)}")
+                attempts = job.get("attempts", 1)
+                now = datetime.utcnow()
+                update = {"status": "pending", "error": str(e), "updated_at": now}
+                if attempts >= settings.SUMMARIZATION_MAX_ATTEMPTS:
+                    update["status"] = "failed"
+                else:
+                    # Back off so a job that keeps failing doesn't spin through its attempts
+                    update["not_before"] = now + timedelta(
+                        seconds=settings.SUMMARIZATION_RETRY_BACKOFF_SECONDS * 2 ** (attempts - 1)
+                    )
+                try:
+                    await db["summarization_jobs"].update_one({"_id": job["_id"]}, {"$set": update})
+                except Exception:
+                    logger.exception("Could not record summarization failure")
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, db: AsyncIOMotorDatabase, loop, job: Dict[str, Any]):
+        article = await db["articles"].find_one({"content_hash": job["_id"]}, {"content": 1})
+        if article is None:
+            await db["summarization_jobs"].delete_one({"_id": job["_id"]})
+            return
+
+        executor = self._executor
+        try:
+            summary = await loop.run_in_executor(
+                executor, _summarize, settings.SUMMARIZATION_BACKEND, article.get("content") or ""
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); a broken pool would fail every later job
+            self._replace_executor(executor)
+            raise
+        now = datetime.utcnow()
+        await db["summarization_jobs"].update_one(
+            {"_id": job["_id"]},
+            {"$set": {
+                "status": "done", "summary": summary, "backend": settings.SUMMARIZATION_BACKEND, "updated_at": now
+            }, "$unset": {"lease_until": "", "error": "", "not_before": ""}}
+        )
+        await db["articles"].update_many(
+            {"content_hash": job["_id"]}, {"$set": {"summary": summary, "updated_at": now}}
+        )
+
+
+summarization_service = SummarizationService()
+
+
+def assign_content_hashes(articles: List[Dict[str, Any]]):
+    """Record each article's content hash so summaries can be shared between copies"""
+    for article in articles:
+        digest = content_hash(article)
+        if digest:
+            article["content_hash"] = digest
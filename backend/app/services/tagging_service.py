@@ -0,0 +1,251 @@
+"""
+AI tagging of stored articles. Scheduled runs only tag articles published in the
+last TAGGING_MAX_AGE_DAYS; to tag older articles once, run from the backend directory:
+
+    python -m app.services.tagging_service            # the whole archive
+    python -m app.services.tagging_service 90         # the last 90 days
+"""
+import asyncio
+import logging
+import math
+import multiprocessing
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9\-]{2,}")
+
+STOPWORDS = {
+    "about", "after", "again", "against", "all", "also", "and", "any", "are", "around", "back",
+    "been", "before", "being", "between", "both", "but", "can", "could", "did", "does", "down",
+    "during", "each", "even", "few", "first", "for", "from", "further", "get", "had", "has",
+    "have", "her", "here", "him", "his", "how", "into", "its", "just", "last", "like", "made",
+    "make", "many", "more", "most", "much", "new", "news", "not", "now", "off", "old", "one",
+    "only", "other", "our", "out", "over", "own", "said", "same", "says", "she", "should",
+    "since", "some", "still", "such", "than", "that", "the", "their", "them", "then", "there",
+    "these", "they", "this", "those", "through", "time", "too", "two", "under", "until", "very",
+    "was", "way", "week", "were", "what", "when", "where", "which", "while", "who", "why", "will",
+    "with", "would", "year", "years", "yet", "you", "your", "chars",
+}
+
+
+class KeywordTagger:
+    """
+    TF-IDF keyword tagger. Title terms count triple. Document frequencies
+    accumulate over every batch this instance sees, so idf improves as the
+    worker process stays up.
+    """
+
+    def __init__(self, max_tags: int):
+        self.max_tags = max_tags
+        self.document_count = 0
+        self.document_frequency: Counter = Counter()
+
+    @staticmethod
+    def _terms(article: Dict[str, Any]) -> Counter:
+        def tokens(text):
+            return [t for t in TOKEN_PATTERN.findall((text or "").lower()) if t not in STOPWORDS]
+        counts = Counter(tokens(article.get("synopsis")) + tokens(article.get("content")))
+        for token in tokens(article.get("title")):
+            counts[token] += 3
+        return counts
+
+    def tag(self, articles: List[Dict[str, Any]]) -> List[List[str]]:
+        term_counts = [self._terms(article) for article in articles]
+        for counts in term_counts:
+            self.document_frequency.update(counts.keys())
+        self.document_count += len(articles)
+
+        results = []
+        for counts in term_counts:
+            total = sum(counts.values()) or 1
+            scored = [
+                (count / total * (math.log((1 + self.document_count) / (1 + self.document_frequency[term])) + 1), term)
+                for term, count in counts.items()
+            ]
+            scored.sort(reverse=True)
+            results.append([term for _, term in scored[:self.max_tags]])
+        return results
+
+
+class ZeroShotTagger:
+    """Local transformers zero-shot classifier over the configured candidate labels"""
+
+    def __init__(self, model: str, labels: List[str], max_tags: int, threshold: float):
+        from transformers import pipeline  # Heavy import, only in workers that use it
+        self.classifier = pipeline("zero-shot-classification", model=model)
+        self.labels = labels
+        self.max_tags = max_tags
+        self.threshold = threshold
+
+    def tag(self, articles: List[Dict[str, Any]]) -> List[List[str]]:
+        texts = [f"{a.get('title') or ''}. {a.get('synopsis') or ''}"[:1000] for a in articles]
+        outputs = self.classifier(texts, candidate_labels=self.labels, multi_label=True)
+        if isinstance(outputs, dict):
+            outputs = [outputs]
+        return [
+            [label for label, score in zip(out["labels"], out["scores"]) if score >= self.threshold][:self.max_tags]
+            for out in outputs
+        ]
+
+
+@lru_cache(maxsize=None)
+def _get_tagger(backend: str):
+    """Load the tagger once per worker process, on first use"""
+    if backend == "zero-shot":
+        return ZeroShotTagger(
+            settings.TAGGING_MODEL, settings.TAGGING_LABELS,
+            settings.TAGGING_MAX_TAGS, settings.TAGGING_MIN_SCORE
+        )
+    return KeywordTagger(settings.TAGGING_MAX_TAGS)
+
+
+def _tag_batch(backend: str, articles: List[Dict[str, Any]]) -> List[List[str]]:
+    """Process pool entry point"""
+    return _get_tagger(backend).tag(articles)
+
+
+class TaggingService:
+    """
+    Tags untagged articles in batches on a process pool, so inference never runs
+    on the event loop, and writes the tags back with one bulk update per batch.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Dict[str, Any] = {}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs Motor's threads and the event loop is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.TAGGING_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _reset_executor(self):
+        """Drop the pool so the next batch starts a fresh one"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def tag_pending(
+        self,
+        db: AsyncIOMotorDatabase,
+        max_batches: Optional[int] = None,
+        max_age_days: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Tag untagged articles published within max_age_days (TAGGING_MAX_AGE_DAYS by
+        default), oldest first; 0 takes the whole archive
+        """
+        if max_age_days is None:
+            max_age_days = settings.TAGGING_MAX_AGE_DAYS
+        query: Dict[str, Any] = {"tagged_at": None}
+        if max_age_days > 0:
+            query["published_date"] = {"$gte": datetime.utcnow() - timedelta(days=max_age_days)}
+
+        loop = asyncio.get_running_loop()
+        tagged = 0
+        batches = 0
+        started = time.perf_counter()
+        inference_seconds = 0.0
+
+        while max_batches is None or batches < max_batches:
+            articles = await db["articles"].find(
+                query,
+                {"_id": 0, "id": 1, "title": 1, "synopsis": 1, "content": 1}
+            ).sort("published_date", 1).limit(settings.TAGGING_BATCH_SIZE).to_list(length=settings.TAGGING_BATCH_SIZE)
+            if not articles:
+                break
+
+            inference_started = time.perf_counter()
+            try:
+                tags = await loop.run_in_executor(
+                    self._get_executor(), _tag_batch, settings.TAGGING_BACKEND, articles
+                )
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed) and a broken pool rejects every later
+                # batch; the articles stay untagged and the next run gets a new pool
+                logger.warning("Tagging process pool broke; it will be recreated")
+                self._reset_executor()
+                raise
+            inference_seconds += time.perf_counter() - inference_started
+
+            now = datetime.utcnow()
+            await db["articles"].bulk_write([
+                UpdateOne({"id": article["id"]}, {"$set": {"ai_tags": article_tags, "tagged_at": now}})
+                for article, article_tags in zip(articles, tags)
+            ], ordered=False)
+            tagged += len(articles)
+            batches += 1
+
+        elapsed = time.perf_counter() - started
+        self.last_run = {
+            "backend": settings.TAGGING_BACKEND,
+            "articles": tagged,
+            "batches": batches,
+            "seconds": round(elapsed, 3),
+            "articles_per_second": round(tagged / elapsed, 2) if elapsed and tagged else 0.0,
+            "inference_articles_per_second": round(tagged / inference_seconds, 2) if inference_seconds else 0.0,
+            "finished_at": time.time(),
+        }
+        if tagged:
+            logger.info(
+                f"Tagged {tagged} articles in {elapsed:.2f}s "
+                f"({self.last_run['articles_per_second']} articles/sec, "
+                f"{self.last_run['inference_articles_per_second']} articles/sec in inference)"
+            )
+        return self.last_run
+
+    def schedule(self, db: AsyncIOMotorDatabase):
+        """Start tagging in the background unless a run is already in progress"""
+        if not settings.TAGGING_ENABLED or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.create_task(self._run(db))
+
+    async def _run(self, db: AsyncIOMotorDatabase):
+        try:
+            await self.tag_pending(db)
+        except Exception as e:
+            logger.exception(f"Tagging run failed: {str(e)}")
+
+    async def shutdown(self):
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._reset_executor()
+
+
+tagging_service = TaggingService()
+
+
+async def backfill(max_age_days: int):
+    client = AsyncIOMotorClient(settings.MONGODB_URL)
+    try:
+        await tagging_service.tag_pending(client[settings.DATABASE_NAME], max_age_days=max_age_days)
+    finally:
+        await tagging_service.shutdown()
+        client.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(backfill(int(sys.argv[1]) if len(sys.argv) > 1 else 0))
@@ -0,0 +1,47 @@
+"""
+Compare two bench.run result files metric by metric:
+
+    python -m bench.compare base.json head.json
+"""
+import json
+import sys
+from typing import Any, Dict, Iterator, Tuple
+
+
+def metrics(node: Any, path: str = "") -> Iterator[Tuple[str, float]]:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from metrics(value, f"{path}.{key}" if path else key)
+    elif isinstance(node, (int, float)) and not isinstance(node, bool):
+        yield path, float(node)
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any]) -> str:
+    base_metrics = dict(metrics(base.get("results", {})))
+    head_metrics = dict(metrics(head.get("results", {})))
+    lines = [
+        f"base {base.get('git', {}).get('commit')}  head {head.get('git', {}).get('commit')}",
+        f"{'metric':<55} {'base':>12} {'head':>12} {'change':>9}",
+    ]
+    for name in sorted(set(base_metrics) | set(head_metrics)):
+        old, new = base_metrics.get(name), head_metrics.get(name)
+        if old is None or new is None:
+            change = "n/a"
+        elif old == 0:
+            change = "" if new == 0 else "new"
+        else:
+            change = f"{(new - old) / old * 100:+.1f}%"
+        old_text = "-" if old is None else f"{old:.3f}"
+        new_text = "-" if new is None else f"{new:.3f}"
+        lines.append(f"{name:<55} {old_text:>12} {new_text:>12} {change:>9}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m bench.compare BASE.json HEAD.json")
+    with open(sys.argv[1]) as f:
+        base_report = json.load(f)
+    with open(sys.argv[2]) as f:
+        head_report = json.load(f)
+    print(compare(base_report, head_report))
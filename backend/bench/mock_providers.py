@@ -0,0 +1,185 @@
+"""
+In-process stand-in for the provider hosts. Installed as the transport of the shared
+HTTP clients, it answers NewsAPI, GNews, Guardian, Mediastack and RSS requests in each
+provider's response format, after a configurable delay, with generated articles of a
+configurable size. Every response carries fresh URLs, so nothing is deduplicated away.
+"""
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+from xml.sax.saxutils import escape
+
+import httpx
+
+WORDS = (
+    "market rally energy court election storm vaccine launch merger tariff drought league "
+    "chip satellite budget strike summit protest quake startup museum ocean transit senate "
+    "climate inflation harvest stadium rocket bank treaty festival virus reactor airline"
+).split()
+
+FEED_HOST = "feeds.bench.local"
+
+
+class MockProviderTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        articles_per_page: int = 20,
+        pages: int = 5,
+        content_bytes: int = 2000,
+        seed: int = 1
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.articles_per_page = articles_per_page
+        self.pages = pages
+        self.content_bytes = content_bytes
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.bytes_sent = 0
+        self._serial = 0
+        self._builders: Dict[str, Callable[[Dict[str, str]], bytes]] = {
+            "newsapi.org": self._newsapi,
+            "gnews.io": self._gnews,
+            "content.guardianapis.com": self._guardian,
+            "api.mediastack.com": self._mediastack,
+            FEED_HOST: self._rss,
+        }
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = self.latency + (self.random.uniform(-self.jitter, self.jitter) if self.jitter else 0.0)
+        await asyncio.sleep(max(0.0, delay))
+        builder = self._builders.get(request.url.host)
+        if builder is None:
+            return httpx.Response(404, request=request)
+        body = builder(dict(request.url.params))
+        self.requests += 1
+        self.bytes_sent += len(body)
+        content_type = "application/rss+xml" if request.url.host == FEED_HOST else "application/json"
+        return httpx.Response(200, content=body, headers={"content-type": content_type}, request=request)
+
+    def _items(self) -> List[Dict[str, Any]]:
+        now = datetime.utcnow()
+        items = []
+        for i in range(self.articles_per_page):
+            self._serial += 1
+            title = " ".join(self.random.choice(WORDS) for _ in range(8))
+            body_words = []
+            while sum(len(w) + 1 for w in body_words) < self.content_bytes:
+                body_words.append(self.random.choice(WORDS))
+            items.append({
+                "title": f"{title.capitalize()} {self._serial}",
+                "url": f"https://bench.local/articles/{self._serial}",
+                "summary": " ".join(body_words[:30]),
+                "content": " ".join(body_words) + ".",
+                "published": (now - timedelta(seconds=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            })
+        return items
+
+    def _json(self, payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload).encode("utf-8")
+
+    def _newsapi(self, params: Dict[str, str]) -> bytes:
+        return self._json({
+            "status": "ok",
+            "totalResults": self.articles_per_page * self.pages,
+            "articles": [
+                {
+                    "source": {"id": None, "name": "Bench Wire"},
+                    "author": "Bench Reporter",
+                    "title": item["title"],
+                    "description": item["summary"],
+                    "url": item["url"],
+                    "urlToImage": item["url"] + ".jpg",
+                    "publishedAt": item["published"],
+                    "content": item["content"],
+                }
+                for item in self._items()
+            ],
+        })
+
+    def _gnews(self, params: Dict[str, str]) -> bytes:
+        return self._json({
+            "totalArticles": self.articles_per_page * self.pages,
+            "articles": [
+                {
+                    "title": item["title"],
+                    "description": item["summary"],
+                    "content": item["content"],
+                    "url": item["url"],
+                    "image": item["url"] + ".jpg",
+                    "publishedAt": item["published"],
+                    "source": {"name": "Bench Daily", "url": "https://bench.local"},
+                }
+                for item in self._items()
+            ],
+        })
+
+    def _guardian(self, params: Dict[str, str]) -> bytes:
+        return self._json({
+            "response": {
+                "status": "ok",
+                "total": self.articles_per_page * self.pages,
+                "pages": self.pages,
+                "results": [
+                    {
+                        "webTitle": item["title"],
+                        "webUrl": item["url"],
+                        "webPublicationDate": item["published"],
+                        "sectionName": (params.get("section") or "news").title(),
+                        "fields": {
+                            "headline": item["title"],
+                            "byline": "Bench Correspondent",
+                            "trailText": item["summary"],
+                            "bodyText": item["content"],
+                            "thumbnail": item["url"] + ".jpg",
+                        },
+                    }
+                    for item in self._items()
+                ],
+            }
+        })
+
+    def _mediastack(self, params: Dict[str, str]) -> bytes:
+        return self._json({
+            "pagination": {
+                "limit": self.articles_per_page,
+                "offset": int(params.get("offset", 0)),
+                "count": self.articles_per_page,
+                "total": self.articles_per_page * self.pages,
+            },
+            "data": [
+                {
+                    "author": "Bench Staff",
+                    "title": item["title"],
+                    "description": item["summary"],
+                    "url": item["url"],
+                    "source": "Bench Times",
+                    "image": item["url"] + ".jpg",
+                    "category": params.get("categories", "general"),
+                    "language": "en",
+                    "country": "us",
+                    "published_at": item["published"],
+                }
+                for item in self._items()
+            ],
+        })
+
+    def _rss(self, params: Dict[str, str]) -> bytes:
+        entries = "".join(
+            f"<item><title>{escape(item['title'])}</title><link>{item['url']}</link>"
+            f"<description>{escape(item['summary'])}</description>"
+            f"<pubDate>{item['published']}</pubDate></item>"
+            for item in self._items()
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>Bench Feed</title>{entries}</channel></rss>"
+        ).encode("utf-8")
+
+
+def feed_urls(count: int) -> List[str]:
+    return [f"https://{FEED_HOST}/feeds/{i}.xml" for i in range(count)]
@@ -0,0 +1,354 @@
+"""
+Offline benchmarks for the ingestion and read paths. Run from the backend directory:
+
+    python -m bench.run --output bench-results.json
+    python -m bench.run --mongo-url mongodb://localhost:27017 --archive-sizes 10000,100000
+    python -m bench.compare base.json head.json
+
+Providers are served by bench.mock_providers; nothing leaves the machine. Without
+--mongo-url the database is mongomock-motor (pip install -r bench/requirements.txt),
+which is fine for comparing commits but far slower than mongod on large archives.
+With --mongo-url everything goes to the database named by --database, which is
+dropped at the end.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger("bench")
+
+CATEGORIES = ["business", "technology", "science", "health", "sports", "entertainment", "world", "politics"]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def latency_summary(seconds: List[float]) -> Dict[str, float]:
+    millis = [s * 1000 for s in seconds]
+    return {
+        "count": len(millis),
+        "mean_ms": round(sum(millis) / len(millis), 3) if millis else 0.0,
+        "p50_ms": round(percentile(millis, 50), 3),
+        "p95_ms": round(percentile(millis, 95), 3),
+        "p99_ms": round(percentile(millis, 99), 3),
+        "max_ms": round(max(millis), 3) if millis else 0.0,
+    }
+
+
+async def timed(func: Callable[[], Awaitable[Any]]) -> float:
+    started = time.perf_counter()
+    await func()
+    return time.perf_counter() - started
+
+
+async def run_concurrently(count: int, concurrency: int, func: Callable[[], Awaitable[Any]]) -> List[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> float:
+        async with semaphore:
+            return await timed(func)
+
+    return await asyncio.gather(*(one() for _ in range(count)))
+
+
+def configure(args: argparse.Namespace):
+    """Point the app at the mock providers and take the limits meant for real APIs off"""
+    settings.DATABASE_NAME = args.database
+    settings.NEWSAPI_API_KEY = "bench"
+    settings.GNEWS_API_KEY = "bench"
+    settings.GUARDIAN_API_KEY = "bench"
+    settings.MEDIASTACK_API_KEY = "bench"
+    settings.INGESTION_ENABLED = False
+    settings.TAGGING_ENABLED = False
+    settings.SUMMARIZATION_ENABLED = False
+    # The refresh scenario times the whole fetch, so the request must wait for it
+    settings.REFRESH_MAX_WAIT_SECONDS = 600.0
+    settings.PROVIDER_RATE_LIMITS = {}
+    settings.PROVIDER_DAILY_QUOTAS = {}
+    settings.PROVIDER_RETRIES = 0
+    settings.PROVIDER_MAX_PAGES = {provider: args.pages for provider in ("newsapi", "gnews", "guardian", "mediastack")}
+    settings.BCRYPT_ROUNDS = args.bcrypt_rounds
+
+
+async def connect(args: argparse.Namespace):
+    from app.db.base import db
+    if args.mongo_url:
+        from motor.motor_asyncio import AsyncIOMotorClient
+        db.client = AsyncIOMotorClient(args.mongo_url)
+    else:
+        try:
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            sys.exit("mongomock-motor is not installed; pip install -r bench/requirements.txt or pass --mongo-url")
+        db.client = AsyncMongoMockClient()
+    return db.client[args.database]
+
+
+async def reset_fetch_state(database):
+    """Forget what was fetched, so every iteration downloads and parses full pages"""
+    from app.services.provider_gateway import provider_gateway
+    await database["provider_fetch_state"].delete_many({})
+    provider_gateway.gates.clear()
+
+
+async def bench_get_articles(args, database, transport) -> Dict[str, Any]:
+    from app.services.news_api_service import get_articles
+
+    durations = []
+    articles = 0
+    requests_before = transport.requests
+    bytes_before = transport.bytes_sent
+    for _ in range(args.iterations):
+        await reset_fetch_state(database)
+        started = time.perf_counter()
+        fetched = (await get_articles(CATEGORIES)).articles
+        durations.append(time.perf_counter() - started)
+        articles += len(fetched)
+
+    total = sum(durations)
+    return {
+        "iterations": args.iterations,
+        "articles": articles,
+        "provider_requests": transport.requests - requests_before,
+        "response_bytes": transport.bytes_sent - bytes_before,
+        "articles_per_second": round(articles / total, 2) if total else 0.0,
+        "latency": latency_summary(durations),
+    }
+
+
+async def bench_refresh(args, database, client: httpx.AsyncClient) -> Dict[str, Any]:
+    await database["articles"].delete_many({})
+    durations = []
+    for _ in range(args.iterations):
+        await reset_fetch_state(database)
+        started = time.perf_counter()
+        response = await client.get(
+            "/api/v1/articles/latest", params={"refresh": "true", "limit": 20, "categories": CATEGORIES}
+        )
+        response.raise_for_status()
+        durations.append(time.perf_counter() - started)
+
+    return {
+        "iterations": args.iterations,
+        "inserted": await database["articles"].count_documents({}),
+        "latency": latency_summary(durations),
+    }
+
+
+def archive_article(i: int, now: datetime, rng: random.Random) -> Dict[str, Any]:
+    published = now - timedelta(minutes=i)
+    return {
+        "id": f"bench-{i:08d}",
+        "title": f"Archived story {i}",
+        "source": rng.choice(["Bench Wire", "Bench Daily", "The Guardian", "Bench Times"]),
+        "source_url": f"https://bench.local/archive/{i}",
+        "author": "Bench Reporter",
+        "published_date": published,
+        "synopsis": "An archived article used for read benchmarks.",
+        "content": "Lorem ipsum " * 100,
+        "image_url": None,
+        "categories": rng.sample(CATEGORIES, 2),
+        "ai_tags": [],
+        "created_at": published,
+        "updated_at": published,
+        "tagged_at": published,
+    }
+
+
+async def seed_archive(database, size: int):
+    from app.db.indexes import ensure_indexes
+
+    await database["articles"].delete_many({})
+    await ensure_indexes(database)
+    now = datetime.utcnow()
+    rng = random.Random(size)
+    for start in range(0, size, 1000):
+        await database["articles"].insert_many(
+            [archive_article(i, now, rng) for i in range(start, min(size, start + 1000))]
+        )
+
+
+async def bench_reads(args, database, client: httpx.AsyncClient) -> Dict[str, Any]:
+    from app.core.cache import article_cache
+
+    results = {}
+    for size in args.archive_sizes:
+        await seed_archive(database, size)
+        article_cache.clear()
+
+        first_page = await client.get("/api/v1/articles/", params={"limit": 20})
+        first_page.raise_for_status()
+        cursor = first_page.json()["next_cursor"]
+
+        endpoints = {
+            "list": ("/api/v1/articles/", {"limit": 20}),
+            "list_category": ("/api/v1/articles/", {"limit": 20, "category": "technology"}),
+            "list_cursor": ("/api/v1/articles/", {"limit": 20, "cursor": cursor}),
+            "latest_cached": ("/api/v1/articles/latest", {"limit": 20}),
+        }
+        size_results = {}
+        for name, (path, params) in endpoints.items():
+            async def read(path=path, params=params):
+                response = await client.get(path, params=params)
+                response.raise_for_status()
+
+            started = time.perf_counter()
+            durations = await run_concurrently(args.reads, args.concurrency, read)
+            elapsed = time.perf_counter() - started
+            size_results[name] = {
+                "requests_per_second": round(len(durations) / elapsed, 2) if elapsed else 0.0,
+                "latency": latency_summary(durations),
+            }
+        results[str(size)] = size_results
+    return results
+
+
+async def bench_login(args, database, client: httpx.AsyncClient) -> Dict[str, Any]:
+    from app.core.security import password_hasher
+
+    await database["users"].delete_many({})
+    credentials = {"email": "bench@example.com", "name": "Bench", "password": "bench-password"}
+    response = await client.post("/api/v1/auth/register", json=credentials)
+    response.raise_for_status()
+
+    async def login():
+        response = await client.post(
+            "/api/v1/auth/login",
+            data={"username": credentials["email"], "password": credentials["password"]}
+        )
+        response.raise_for_status()
+
+    started = time.perf_counter()
+    durations = await run_concurrently(args.logins, args.concurrency, login)
+    elapsed = time.perf_counter() - started
+    return {
+        "logins": len(durations),
+        "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+        "logins_per_second": round(len(durations) / elapsed, 2) if elapsed else 0.0,
+        "latency": latency_summary(durations),
+        "hasher": password_hasher.stats(),
+    }
+
+
+def git_revision() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    configure(args)
+    from bench.mock_providers import MockProviderTransport, feed_urls
+    settings.RSS_FEEDS = [{"url": url, "categories": ["technology"]} for url in feed_urls(args.feeds)]
+
+    from app.core.security import password_hasher
+    from app.main import app
+    from app.services.http_client import close_http_clients, open_http_clients
+
+    database = await connect(args)
+    transport = MockProviderTransport(
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        articles_per_page=args.page_size,
+        pages=args.pages,
+        content_bytes=args.content_bytes,
+    )
+    await open_http_clients(transport=transport)
+
+    scenarios = {
+        "get_articles": lambda: bench_get_articles(args, database, transport),
+    }
+    # ASGITransport skips startup/shutdown events; the database is already connected above
+    api = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+    scenarios["refresh"] = lambda: bench_refresh(args, database, api)
+    scenarios["reads"] = lambda: bench_reads(args, database, api)
+    scenarios["login"] = lambda: bench_login(args, database, api)
+
+    results: Dict[str, Any] = {}
+    try:
+        for name in args.scenarios:
+            logger.warning(f"Running {name}")
+            try:
+                started = time.perf_counter()
+                results[name] = await scenarios[name]()
+                results[name]["wall_seconds"] = round(time.perf_counter() - started, 3)
+            except Exception as e:
+                logger.exception(f"Scenario {name} failed")
+                results[name] = {"error": f"{type(e).__name__}: {str(e)}"}
+    finally:
+        await api.aclose()
+        await close_http_clients()
+        password_hasher.shutdown()
+        from app.db.base import db
+        await db.client.drop_database(args.database)
+        db.client.close()
+
+    return {
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "git": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "database": "mongod" if args.mongo_url else "mongomock",
+        "parameters": {
+            name: value for name, value in vars(args).items()
+            if name not in ("output", "mongo_url")
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    def int_list(value: str) -> List[int]:
+        return [int(v) for v in value.split(",") if v]
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", default=["get_articles", "refresh", "reads", "login"],
+                        choices=["get_articles", "refresh", "reads", "login"])
+    parser.add_argument("--mongo-url", help="Use this mongod instead of mongomock")
+    parser.add_argument("--database", default="mynews_bench")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mock provider response delay")
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--page-size", type=int, default=20, help="Articles per mock provider page")
+    parser.add_argument("--pages", type=int, default=1, help="Pages each provider query follows")
+    parser.add_argument("--content-bytes", type=int, default=2000, help="Article body size")
+    parser.add_argument("--feeds", type=int, default=0, help="Mock RSS feeds to fetch alongside the APIs")
+    parser.add_argument("--iterations", type=int, default=5, help="get_articles / refresh runs")
+    parser.add_argument("--archive-sizes", type=int_list, default=[1000, 10000])
+    parser.add_argument("--reads", type=int, default=200, help="Requests per read endpoint and archive size")
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--bcrypt-rounds", type=int, default=settings.BCRYPT_ROUNDS)
+    parser.add_argument("--output", help="Write the JSON results here as well as to stdout")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    arguments = parse_args()
+    report = asyncio.run(main(arguments))
+    output = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
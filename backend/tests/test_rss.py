@@ -0,0 +1,273 @@
+"""
+RSS/Atom provider tests. Run from the backend directory:
+
+    pip install -r tests/requirements.txt
+    python -m pytest -q
+"""
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from xml.etree.ElementTree import ParseError
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.db.base import db
+from app.services.fetch_state import FetchBatch, fetch_state_store
+from app.services.provider_gateway import ProviderError
+from app.services.providers.engine import FetchEngine
+from app.services.providers.rss import FeedParser, FeedProvider
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+RSS2_TITLES = [
+    "Chipmaker unveils faster processor",
+    "Open source database reaches 2.0",
+    "Phones get longer support",
+]
+
+
+def fixture_bytes(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+def chunked(data: bytes, size: int) -> Iterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def parse(data: bytes, chunk_size: Optional[int] = None) -> List[Dict[str, Any]]:
+    parser = FeedParser()
+    entries: List[Dict[str, Any]] = []
+    for chunk in chunked(data, chunk_size or len(data)):
+        entries.extend(parser.feed(chunk))
+    entries.extend(parser.close())
+    return entries
+
+
+def feed_transport(body: bytes, chunk_size: int = 256, headers: Optional[Dict[str, str]] = None,
+                   seen: Optional[List[httpx.Request]] = None,
+                   respond: Optional[Callable[[httpx.Request], Optional[httpx.Response]]] = None) -> httpx.MockTransport:
+    """Serves body in chunk_size pieces, the way a slow feed host streams it"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if seen is not None:
+            seen.append(request)
+        if respond is not None:
+            response = respond(request)
+            if response is not None:
+                return response
+
+        async def stream():
+            for chunk in chunked(body, chunk_size):
+                yield chunk
+
+        return httpx.Response(200, headers=headers or {}, content=stream())
+
+    return httpx.MockTransport(handler)
+
+
+async def fetch(url: str, transport: httpx.MockTransport, categories: Optional[List[str]] = None) -> FetchBatch:
+    async with httpx.AsyncClient(transport=transport) as client:
+        return await FeedProvider().fetch_query(FetchEngine(), client, url, categories or ["technology"])
+
+
+@pytest.fixture
+def database(monkeypatch):
+    """mongomock-backed database for the fetch state and the provider gateway"""
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    monkeypatch.setattr(db, "client", mongomock_motor.AsyncMongoMockClient())
+    return db.client[settings.DATABASE_NAME]
+
+
+@pytest.fixture(autouse=True)
+def rss_settings(monkeypatch):
+    monkeypatch.setattr(settings, "RSS_FEEDS", [
+        {"url": "https://wire.example.com/rss", "name": "Tech Wire", "categories": ["technology"]},
+        {"url": "https://science.example.org/atom", "categories": ["science"]},
+    ])
+    monkeypatch.setattr(settings, "RSS_MAX_ENTRIES_PER_FEED", 50)
+    monkeypatch.setattr(settings, "RSS_MAX_BYTES", 5 * 1024 * 1024)
+    # Fail fast instead of backing off between retries
+    monkeypatch.setattr(settings, "PROVIDER_RETRIES", 0)
+
+
+# FeedParser
+
+
+def test_parses_rss2_items():
+    entries = parse(fixture_bytes("rss2.xml"))
+
+    assert len(entries) == 4
+    chip, database_release, untitled, phones = entries
+    assert chip["title"] == "Chipmaker unveils faster processor"
+    assert chip["link"] == "https://wire.example.com/chips"
+    assert chip["author"] == "Ada Writer"
+    assert chip["categories"] == ["Hardware", "Chips"]
+    assert chip["image"] == "https://img.example.com/chip.jpg"
+    assert chip["content"].startswith("<p>The new chip")
+    # A permalink guid stands in for a missing link; a non-permalink one never does
+    assert database_release["link"] == "https://wire.example.com/db-2"
+    assert database_release["image"] == "https://img.example.com/db.png"
+    assert "title" not in untitled
+    assert phones["link"] == "https://wire.example.com/phones"
+    assert "guid" not in phones
+
+
+def test_parses_atom_entries():
+    parser = FeedParser()
+    entries = list(parser.feed(fixture_bytes("atom.xml"))) + list(parser.close())
+
+    assert parser.feed_title == "Example Science Journal"
+    assert len(entries) == 2
+    planet, oceans = entries
+    assert planet["title"] == 'Telescope spots "new" exoplanet'
+    # rel="alternate" wins over rel="self"
+    assert planet["link"] == "https://science.example.org/exoplanet"
+    assert planet["author"] == "Grace Observer"
+    assert planet["categories"] == ["Astronomy"]
+    assert planet["image"] == "https://img.example.org/planet-thumb.jpg"
+    assert planet["published"] == "2024-01-03T09:00:00+01:00"
+    assert oceans["link"] == "https://science.example.org/oceans"
+    assert "published" not in oceans and oceans["updated"] == "2024-01-02T18:30:00Z"
+
+
+@pytest.mark.parametrize("name", ["rss2.xml", "atom.xml"])
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_chunked_input_parses_like_the_whole_document(name, chunk_size):
+    data = fixture_bytes(name)
+    assert parse(data, chunk_size) == parse(data)
+
+
+def test_entries_are_yielded_as_they_complete_and_detached():
+    data = fixture_bytes("rss2.xml")
+    first_item_end = data.index(b"</item>") + len(b"</item>")
+    parser = FeedParser()
+
+    entries = list(parser.feed(data[:first_item_end]))
+    assert [e["title"] for e in entries] == [RSS2_TITLES[0]]
+
+    entries += list(parser.feed(data[first_item_end:data.index(b"</channel>")]))
+    assert len(entries) == 4
+    # Only the channel's own fields are left in the tree, not the parsed items
+    channel = parser._stack[-1]
+    assert [child.tag for child in channel] == ["title", "link", "description"]
+
+
+def test_truncated_feed_yields_complete_entries_then_fails():
+    parser = FeedParser()
+    entries = list(parser.feed(fixture_bytes("truncated.xml")))
+
+    assert [e["title"] for e in entries] == ["First complete item", "Second complete item"]
+    with pytest.raises(ParseError):
+        list(parser.close())
+
+
+# FeedProvider normalisation
+
+
+def test_to_article_normalises_rss2_entries():
+    provider = FeedProvider()
+    articles = [provider.to_article(entry, "Tech Wire", ["technology"]) for entry in parse(fixture_bytes("rss2.xml"))]
+
+    chip, database_release, untitled, phones = articles
+    assert untitled is None
+    assert chip["title"] == "Chipmaker unveils faster processor"
+    assert chip["source"] == "Tech Wire"
+    assert chip["source_url"] == "https://wire.example.com/chips"
+    assert chip["author"] == "Ada Writer"
+    # Naive UTC, converted from +02:00
+    assert chip["published_date"] == datetime(2024, 1, 2, 8, 30)
+    assert chip["synopsis"] == "The new chip is twice as fast."
+    assert chip["content"] == "The new chip is twice as fast. It ships in spring."
+    assert chip["image_url"] == "https://img.example.com/chip.jpg"
+    assert chip["categories"] == ["technology"]
+    # Without content:encoded the content falls back to the description
+    assert database_release["content"] == "Release notes for the 2.0 release."
+    assert phones["published_date"] == datetime(2023, 12, 30, 9, 15)
+
+
+def test_to_article_normalises_atom_entries():
+    provider = FeedProvider()
+    planet, oceans = [provider.to_article(entry, "Science", ["science"]) for entry in parse(fixture_bytes("atom.xml"))]
+
+    assert planet["published_date"] == datetime(2024, 1, 3, 8, 0)
+    assert planet["synopsis"] == "A rocky planet in the habitable zone."
+    assert planet["author"] == "Grace Observer"
+    # Entries with only <updated> are dated by it
+    assert oceans["published_date"] == datetime(2024, 1, 2, 18, 30)
+    assert oceans["author"] is None
+
+
+# FeedProvider.fetch_query
+
+
+def test_fetch_streams_and_names_the_source(database):
+    batch = asyncio.run(fetch("https://wire.example.com/rss", feed_transport(fixture_bytes("rss2.xml"), chunk_size=5)))
+
+    assert [a["title"] for a in batch.articles] == RSS2_TITLES
+    # The configured feed name wins over the channel title
+    assert {a["source"] for a in batch.articles} == {"Tech Wire"}
+    assert len(batch.states) == 1 and batch.states[0].newest_published == datetime(2024, 1, 2, 8, 30)
+
+    atom = asyncio.run(fetch("https://science.example.org/atom", feed_transport(fixture_bytes("atom.xml")), ["science"]))
+    assert {a["source"] for a in atom.articles} == {"Example Science Journal"}
+
+
+def test_fetch_stops_at_max_entries(database, monkeypatch):
+    monkeypatch.setattr(settings, "RSS_MAX_ENTRIES_PER_FEED", 2)
+    batch = asyncio.run(fetch("https://wire.example.com/rss", feed_transport(fixture_bytes("rss2.xml"))))
+
+    assert [a["title"] for a in batch.articles] == RSS2_TITLES[:2]
+
+
+def test_fetch_stops_reading_an_oversized_feed(database, monkeypatch):
+    data = fixture_bytes("rss2.xml")
+    monkeypatch.setattr(settings, "RSS_MAX_BYTES", data.index(b"</item>") + len(b"</item>"))
+    seen: List[httpx.Request] = []
+    batch = asyncio.run(fetch("https://wire.example.com/rss", feed_transport(data, chunk_size=1, seen=seen)))
+
+    # Entries completed within the byte budget are kept; the rest is never parsed
+    assert [a["title"] for a in batch.articles] == RSS2_TITLES[:1]
+    assert len(seen) == 1
+
+
+def test_fetch_of_a_truncated_feed_is_a_provider_error(database):
+    url = "https://flaky.example.net/rss"
+    with pytest.raises(ProviderError, match="invalid feed"):
+        asyncio.run(fetch(url, feed_transport(fixture_bytes("truncated.xml"))))
+
+
+def test_not_modified_feed_returns_an_empty_batch(database):
+    url = "https://wire.example.com/rss"
+    validators = {"ETag": '"v1"', "Last-Modified": "Tue, 02 Jan 2024 09:00:00 GMT"}
+    seen: List[httpx.Request] = []
+
+    def not_modified(request: httpx.Request) -> Optional[httpx.Response]:
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return None
+
+    transport = feed_transport(fixture_bytes("rss2.xml"), headers=validators, seen=seen, respond=not_modified)
+    first = asyncio.run(fetch(url, transport))
+    assert len(first.articles) == 3
+    assert "if-none-match" not in seen[0].headers
+
+    asyncio.run(fetch_state_store.save_all(first.states))
+    second = asyncio.run(fetch(url, transport))
+
+    assert seen[1].headers["if-none-match"] == '"v1"'
+    assert seen[1].headers["if-modified-since"] == validators["Last-Modified"]
+    assert second.articles == [] and second.states == []
+
+
+def test_refetch_skips_entries_older_than_the_saved_state(database):
+    url = "https://wire.example.com/rss"
+    first = asyncio.run(fetch(url, feed_transport(fixture_bytes("rss2.xml"))))
+    asyncio.run(fetch_state_store.save_all(first.states))
+
+    # No validators were sent back, so the feed is downloaded again
+    second = asyncio.run(fetch(url, feed_transport(fixture_bytes("rss2.xml"))))
+
+    assert [a["title"] for a in second.articles] == RSS2_TITLES[:1]
@@ -21,11 +21,12 @@ import {
   Flex
 } from '@chakra-ui/react';
 import { ChevronDownIcon, RepeatIcon } from '@chakra-ui/icons';
-import { useQuery } from 'react-query';
+import { useInfiniteQuery, useQuery } from 'react-query';
 import Layout from '../Layout';
 import ArticleGrid from '../articles/ArticleGrid';
 import { articles as articlesApi } from '../../services/api';
-import { Article, CategoryInfo, SourceInfo } from '../../types/article';
+import { ArticlePage, CategoryInfo, SourceInfo } from '../../types/article';
+import { AxiosResponse } from 'axios';
 
 const HomePage = () => {
   const toast = useToast();
@@ -42,52 +43,46 @@ const HomePage = () => {
     staleTime: 1000 * 60 * 60, // 1 hour
   });
   
-  // Fetch latest articles
+  // Filters shared by the listing and the refresh request
+  const latestParams = (extra: any) => {
+    const params: any = {
+      limit: 20,
+      ...extra
+    };
+    
+    if (activeCategory !== 'all') {
+      params.categories = [activeCategory];
+    }
+    
+    if (activeSource !== 'all') {
+      params.sources = [activeSource];
+    }
+    
+    return params;
+  };
+  
+  // Fetch latest articles, one cursor page at a time so pages stay stable while new articles arrive
   const { 
     data: articlesData, 
     isLoading, 
     isError, 
-    refetch 
-  } = useQuery<{ data: Article[] }>(
+    refetch,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage
+  } = useInfiniteQuery<AxiosResponse<ArticlePage>>(
     ['latest-articles', activeCategory, activeSource],
-    () => {
-      const params: any = {
-        limit: 20,
-        refresh: false
-      };
-      
-      if (activeCategory !== 'all') {
-        params.categories = [activeCategory];
-      }
-      
-      if (activeSource !== 'all') {
-        params.sources = [activeSource];
-      }
-      
-      return articlesApi.getLatest(params);
-    },
+    ({ pageParam }) => articlesApi.getLatest(latestParams({ refresh: false, cursor: pageParam })),
     {
       staleTime: 1000 * 60 * 5, // 5 minutes
+      getNextPageParam: (lastPage) => lastPage.data.next_cursor || undefined,
     }
   );
   
   // Refresh articles with latest data from sources
   const refreshArticles = async () => {
     try {
-      const params: any = {
-        limit: 20,
-        refresh: true
-      };
-      
-      if (activeCategory !== 'all') {
-        params.categories = [activeCategory];
-      }
-      
-      if (activeSource !== 'all') {
-        params.sources = [activeSource];
-      }
-      
-      await articlesApi.getLatest(params);
+      await articlesApi.getLatest(latestParams({ refresh: true }));
       await refetch();
       
       toast({
@@ -109,7 +104,7 @@ const HomePage = () => {
   
   const categories = categoriesData?.data || [];
   const sources = sourcesData?.data || [];
-  const articles = articlesData?.data || [];
+  const articles = articlesData?.pages.flatMap(page => page.data.items) || [];
   
   // Calculate index of category tab to select
   const activeTabIndex = (() => {
@@ -192,8 +187,10 @@ const HomePage = () => {
             <TabPanel px={0}>
               <ArticleGrid 
                 articles={articles} 
-                isLoading={isLoading} 
+                isLoading={isLoading || isFetchingNextPage} 
                 isError={isError} 
+                hasMore={!!hasNextPage}
+                loadMore={fetchNextPage}
               />
             </TabPanel>
             {/* We don't actually need separate tab panels since we're using the same component with different data */}
@@ -201,8 +198,10 @@ const HomePage = () => {
               <TabPanel key={category.id} px={0}>
                 <ArticleGrid 
                   articles={articles} 
-                  isLoading={isLoading} 
+                  isLoading={isLoading || isFetchingNextPage} 
                   isError={isError} 
+                  hasMore={!!hasNextPage}
+                  loadMore={fetchNextPage}
                 />
               </TabPanel>
             ))}
@@ -15,12 +15,12 @@ import {
 } from '@chakra-ui/react';
 import NextLink from 'next/link';
 import { format } from 'date-fns';
-import { Article } from '../../types/article';
+import { ArticleSummary } from '../../types/article';
 
 const DEFAULT_IMAGE = 'https://via.placeholder.com/800x400?text=MyNews';
 
 interface ArticleCardProps {
-  article: Article;
+  article: ArticleSummary;
 }
 
 const ArticleCard: React.FC<ArticleCardProps> = ({ article }) => {
@@ -1,12 +1,12 @@
 'use client';
 
-import React from 'react';
+import React, { useEffect, useRef } from 'react';
 import { Grid, Text, Center, Spinner, Button, VStack } from '@chakra-ui/react';
 import ArticleCard from './ArticleCard';
-import { Article } from '../../types/article';
+import { ArticleSummary } from '../../types/article';
 
 interface ArticleGridProps {
-  articles: Article[];
+  articles: ArticleSummary[];
   isLoading: boolean;
   isError: boolean;
   hasMore?: boolean;
@@ -20,6 +20,21 @@ const ArticleGrid: React.FC<ArticleGridProps> = ({
   hasMore = false, 
   loadMore = undefined
 }) => {
+  // Infinite scroll: load the next page as the end of the grid comes into view
+  const sentinel = useRef<HTMLDivElement>(null);
+  useEffect(() => {
+    const element = sentinel.current;
+    if (!element || !hasMore || !loadMore || isLoading) return;
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some(entry => entry.isIntersecting)) loadMore();
+      },
+      { rootMargin: '400px' }
+    );
+    observer.observe(element);
+    return () => observer.disconnect();
+  }, [hasMore, loadMore, isLoading]);
+
   if (isLoading && articles.length === 0) {
     return (
       <Center py={10}>
@@ -63,11 +78,12 @@ const ArticleGrid: React.FC<ArticleGridProps> = ({
         ))}
       </Grid>
       
+      <div ref={sentinel} />
       {hasMore && loadMore && (
         <Center py={6}>
           <Button
             isLoading={isLoading}
-            onClick={loadMore}
+            onClick={() => loadMore()}
             colorScheme="blue"
           >
             Load More
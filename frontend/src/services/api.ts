@@ -2,7 +2,9 @@ import axios, { AxiosInstance, AxiosRequestConfig, AxiosResponse } from 'axios';
 import { getToken } from './auth';
 import { 
   Article, 
+  ArticleBatch, 
   ArticleCreate, 
+  ArticlePage, 
   CategoryInfo, 
   SourceInfo 
 } from '../types/article';
@@ -49,15 +51,20 @@ export const auth = {
 
 // API methods for articles
 export const articles = {
-  getAll: (params?: any): Promise<AxiosResponse<Article[]>> => 
+  // Listings are cursor paged: pass the previous page's next_cursor as params.cursor
+  getAll: (params?: any): Promise<AxiosResponse<ArticlePage>> => 
     api.get('/articles', { params }),
   
-  getLatest: (params?: any): Promise<AxiosResponse<Article[]>> => 
+  getLatest: (params?: any): Promise<AxiosResponse<ArticlePage>> => 
     api.get('/articles/latest', { params }),
   
   getById: (id: string): Promise<AxiosResponse<Article>> => 
     api.get(`/articles/${id}`),
   
+  // One request for a list of ids, e.g. user.saved_articles
+  getByIds: (ids: string[], params?: any): Promise<AxiosResponse<ArticleBatch>> => 
+    api.post('/articles/batch', { ids }, { params }),
+  
   create: (article: ArticleCreate): Promise<AxiosResponse<Article>> => 
     api.post('/articles', article),
   
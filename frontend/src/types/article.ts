@@ -17,6 +17,33 @@ export interface ArticleBase {
     updated_at: string | Date;
   }
   
+  // Shape returned by list endpoints; request more with the fields= parameter
+  export interface ArticleSummary {
+    id: string;
+    title: string;
+    source: string;
+    source_url: string;
+    author?: string;
+    published_date: string | Date;
+    synopsis?: string;
+    image_url?: string;
+    categories: string[];
+    ai_tags?: string[];
+    score?: number;
+  }
+  
+  // Response of the listing endpoints; pass next_cursor back as cursor for the next page
+  export interface ArticlePage {
+    items: ArticleSummary[];
+    next_cursor: string | null;
+  }
+  
+  // Response of /articles/batch: articles in request order, unknown ids in missing
+  export interface ArticleBatch {
+    articles: ArticleSummary[];
+    missing: string[];
+  }
+  
   export interface ArticleCreate extends ArticleBase {}
   
   export interface ArticleUpdate {